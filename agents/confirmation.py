@@ -33,7 +33,7 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"  # System-level, require explicit confirmation
 
 
-@dataclass
+@dataclass(frozen=True)
 class RiskAssessment:
     """Assessment of risk for a tool call."""
 
@@ -4,8 +4,9 @@ Ollama integration for local LLM inference.
 Provides a simple client for querying local models via Ollama API.
 """
 
+import json
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 
@@ -28,11 +29,13 @@ class OllamaClient:
         settings = get_settings()
         self.endpoint = endpoint or settings.ollama_endpoint
         self.timeout = timeout or settings.ollama_timeout
+        # Keep-alive connection pool shared by every call on this client
+        self._session = requests.Session()
 
     def health_check(self) -> bool:
         """Check if Ollama service is running."""
         try:
-            response = requests.get(f"{self.endpoint}/api/tags", timeout=5)
+            response = self._session.get(f"{self.endpoint}/api/tags", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException as e:
             logger.error(f"Ollama health check failed: {e}")
@@ -41,7 +44,7 @@ class OllamaClient:
     def list_models(self) -> list[str]:
         """Get list of available models."""
         try:
-            response = requests.get(f"{self.endpoint}/api/tags", timeout=self.timeout)
+            response = self._session.get(f"{self.endpoint}/api/tags", timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             return [model["name"] for model in data.get("models", [])]
@@ -76,7 +79,7 @@ class OllamaClient:
                 **kwargs,
             }
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.endpoint}/api/generate",
                 json=payload,
                 timeout=self.timeout,
@@ -107,6 +110,79 @@ class OllamaClient:
             logger.error(f"Generation failed: {e}")
             raise
 
+    def generate_stream(self, model: str, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Generate text, yielding chunks as the model produces them.
+
+        Args:
+            model: Model name
+            prompt: Input prompt
+            **kwargs: Additional parameters (temperature, top_k, etc.)
+
+        Yields:
+            Response text fragments, in order
+        """
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            **kwargs,
+        }
+
+        for data in self._post_stream("/api/generate", payload):
+            if data.get("response"):
+                yield data["response"]
+
+    def chat_stream(self, model: str, messages: list[dict], **kwargs) -> Iterator[str]:
+        """
+        Chat with a model, yielding reply chunks as they are produced.
+
+        Sending structured messages (rather than one flattened prompt) keeps
+        the turn boundaries identical between requests, so Ollama can reuse
+        its cached context for the unchanged start of the conversation.
+
+        Args:
+            model: Model name
+            messages: {"role": "system/user/assistant", "content": "..."} dicts
+            **kwargs: Additional parameters (options, keep_alive, etc.)
+
+        Yields:
+            Reply text fragments, in order
+        """
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": True,
+            **kwargs,
+        }
+
+        for data in self._post_stream("/api/chat", payload):
+            content = data.get("message", {}).get("content")
+            if content:
+                yield content
+
+    def _post_stream(self, path: str, payload: dict) -> Iterator[dict]:
+        """POST a streaming request and yield each JSON line until done."""
+        try:
+            with self._session.post(
+                f"{self.endpoint}{path}",
+                json=payload,
+                timeout=self.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    yield data
+                    if data.get("done"):
+                        break
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Streaming request to {path} failed: {e}")
+            raise
+
     def embed(self, model: str, text: str) -> list[float]:
         """
         Generate embeddings for text.
@@ -124,7 +200,7 @@ class OllamaClient:
                 "prompt": text,
             }
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.endpoint}/api/embeddings",
                 json=payload,
                 timeout=self.timeout,
@@ -151,7 +227,7 @@ class OllamaClient:
         try:
             payload = {"name": model}
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.endpoint}/api/pull",
                 json=payload,
                 timeout=None,  # Pull can take a long time
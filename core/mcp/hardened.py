@@ -11,6 +11,7 @@ from core.mcp.protocol import (
     ErrorCode,
     JSONRPCError,
     JSONRPCResponse,
+    parse_message,
 )
 from core.mcp.rate_limit import RateLimiter, RateLimitConfig, default_rate_limiter
 from core.mcp.security import (
@@ -103,7 +104,7 @@ class HardenedMCPServer(MCPServer):
         try:
             # Parse message
             if isinstance(message, str):
-                data = json.loads(message)
+                data = parse_message(message)
             else:
                 data = message
 
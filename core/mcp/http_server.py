@@ -115,7 +115,8 @@ class MCPHttpServer:
                     # Notification - no response needed
                     return Response(status_code=204)
 
-                return JSONResponse(content=__import__("json").loads(response))
+                # Already serialized by the MCP server; don't parse and re-encode it
+                return Response(content=response, media_type="application/json")
             except Exception as e:
                 logger.exception("JSON-RPC error")
                 return JSONResponse(
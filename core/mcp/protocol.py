@@ -1,13 +1,19 @@
 """MCP Protocol constants and message types per JSON-RPC 2.0 spec."""
 
+import json
+import re
 from enum import Enum
 from typing import Any, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 # Protocol version
 MCP_VERSION = "2024-11-05"
 
+# pydantic-core JSON errors end with the 1-based position of the problem
+_JSON_ERROR_POSITION = re.compile(r"(.*) at line (\d+) column (\d+)$", re.DOTALL)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # JSON-RPC 2.0 Base Types
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -47,6 +53,33 @@ class JSONRPCNotification(BaseModel):
     params: Optional[dict[str, Any]] = None
 
 
+def parse_message(message: Union[str, bytes]) -> Any:
+    """
+    Parse a raw JSON-RPC message.
+
+    Uses pydantic-core's JSON parser, which is several times faster than
+    json.loads on typical request bodies.
+
+    Raises:
+        json.JSONDecodeError: If the message is not valid JSON
+    """
+    try:
+        return from_json(message)
+    except ValueError as e:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="replace")
+        msg, pos = str(e), 0
+        match = _JSON_ERROR_POSITION.match(msg)
+        if match:
+            # Same message/position split as json.loads errors
+            msg, line, column = match.group(1), int(match.group(2)), int(match.group(3))
+            line_start = 0
+            for _ in range(line - 1):
+                line_start = message.find("\n", line_start) + 1
+            pos = min(line_start + max(column - 1, 0), len(message))
+        raise json.JSONDecodeError(msg, message, pos) from None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Standard Error Codes
 # ═══════════════════════════════════════════════════════════════════════════════
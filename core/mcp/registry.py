@@ -11,6 +11,7 @@ from core.mcp.protocol import (
     MCP_VERSION,
     ServerCapabilities,
     ServerInfo,
+    parse_message,
 )
 from core.mcp.server import MCPServer
 from core.mcp.types import Tool, ToolCall, ToolResult
@@ -234,7 +235,7 @@ class MCPServerRegistry:
         import json
 
         if isinstance(message, str):
-            data = json.loads(message)
+            data = parse_message(message)
         else:
             data = message
 
@@ -271,11 +272,9 @@ class MCPServerRegistry:
                 arguments=params.get("arguments", {}),
             )
             result = await self.call_tool(tool_call)
-            return json.dumps({
-                "jsonrpc": "2.0",
-                "id": data.get("id"),
-                "result": result.model_dump(exclude_none=True, by_alias=True),
-            })
+            return JSONRPCResponse(id=data.get("id"), result=result).model_dump_json(
+                exclude_none=True, by_alias=True
+            )
 
         if method == "resources/list":
             resources = [
@@ -25,6 +25,7 @@ from core.mcp.protocol import (
     ResourceContents,
     ServerCapabilities,
     ServerInfo,
+    parse_message,
 )
 from core.mcp.types import (
     PaginatedResult,
@@ -303,7 +304,7 @@ class MCPServer:
         """
         try:
             if isinstance(message, str):
-                data = json.loads(message)
+                data = parse_message(message)
             else:
                 data = message
 
@@ -316,7 +317,7 @@ class MCPServer:
             # Parse as request
             request = JSONRPCRequest(**data)
             response = await self._handle_request(request)
-            return response.model_dump_json(exclude_none=True)
+            return response.model_dump_json(exclude_none=True, by_alias=True)
 
         except json.JSONDecodeError as e:
             error_response = JSONRPCResponse(
@@ -381,7 +382,7 @@ class MCPServer:
     # Protocol Method Handlers
     # ═══════════════════════════════════════════════════════════════════════════
 
-    async def _handle_initialize(self, params: dict) -> dict:
+    async def _handle_initialize(self, params: dict) -> InitializeResult:
         """Handle initialize request."""
         self._client_info = ClientInfo(**params.get("clientInfo", {}))
         self._client_capabilities = ClientCapabilities(**params.get("capabilities", {}))
@@ -396,7 +397,7 @@ class MCPServer:
             serverInfo=ServerInfo(name=self.name, version=self.version),
             instructions=self.instructions,
         )
-        return result.model_dump(exclude_none=True, by_alias=True)
+        return result
 
     async def _handle_shutdown(self, params: dict) -> dict:
         """Handle shutdown request."""
@@ -415,14 +416,13 @@ class MCPServer:
         ]
         return {"tools": tools}
 
-    async def _handle_tools_call(self, params: dict) -> dict:
+    async def _handle_tools_call(self, params: dict) -> ToolResult:
         """Handle tools/call request."""
         tool_call = ToolCall(
             tool_name=params.get("name", ""),
             arguments=params.get("arguments", {}),
         )
-        result = await self.call_tool(tool_call)
-        return result.model_dump(exclude_none=True, by_alias=True)
+        return await self.call_tool(tool_call)
 
     async def _handle_resources_list(self, params: dict) -> dict:
         """Handle resources/list request."""
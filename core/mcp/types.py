@@ -26,7 +26,7 @@ class Tool(BaseModel):
 class ToolCall(BaseModel):
     """Tool invocation."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     tool_name: str = Field(..., alias="name", description="Name of tool to invoke")
     arguments: dict[str, Any] = Field(
@@ -2,9 +2,10 @@
 
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Union
 
 from core.config.settings import get_settings
 from core.llm.ollama import OllamaClient
@@ -171,6 +172,23 @@ class ChatHistoryIngester:
         with open(filepath, "r") as f:
             data = json.load(f)
 
+        conversations = self.ingest_json_data(data)
+        logger.info(f"✅ Ingested {len(conversations)} conversations from {filepath}")
+        return conversations
+
+    def ingest_json_data(self, data: Union[dict, list]) -> List[dict]:
+        """
+        Ingest an already-parsed JSON chat export.
+
+        Accepts the same shapes as ingest_json(): a list of conversations or
+        a dict wrapping them under "conversations".
+
+        Args:
+            data: Parsed chat export
+
+        Returns:
+            List of normalized conversation dicts
+        """
         conversations = []
 
         # Handle both direct list and wrapped format
@@ -188,7 +206,6 @@ class ChatHistoryIngester:
                 logger.warning(f"Skipping malformed conversation {i}: {e}")
                 continue
 
-        logger.info(f"✅ Ingested {len(conversations)} conversations from {filepath}")
         return conversations
 
     def ingest_markdown(self, filepath: Path) -> List[dict]:
@@ -365,19 +382,31 @@ Return ONLY a JSON list of strings:
         Returns:
             Number of conversations stored
         """
-        conversations = self.ingest_file(filepath)
+        return self.store_conversations(self.ingest_file(filepath))
 
-        # Organize by domain and store
-        stored_count = 0
+    def store_conversations(self, conversations: Iterable[dict]) -> int:
+        """
+        Store normalized conversations in their domain memory silos.
 
+        Args:
+            conversations: Conversations from ingest_json_data() or ingest_file()
+
+        Returns:
+            Number of conversations stored
+        """
+        # Organize by domain and store each domain in one batch
+        by_domain = defaultdict(list)
         for conv in conversations:
-            domain = conv.get("domain", "general")
+            by_domain[conv.get("domain", "general")].append(conv)
+
+        stored_count = 0
+
+        for domain, domain_convs in by_domain.items():
             try:
                 memory = DomainMemory(domain)
-                memory.add_conversation(conv)
-                stored_count += 1
+                stored_count += memory.add_conversations(domain_convs)
             except Exception as e:
-                logger.error(f"Failed to store conversation: {e}")
+                logger.error(f"Failed to store {len(domain_convs)} conversations in {domain}: {e}")
 
         logger.info(f"✅ Stored {stored_count} conversations in memory silos")
         return stored_count
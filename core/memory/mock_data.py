@@ -2,7 +2,7 @@
 
 import json
 from datetime import datetime, timedelta
-from typing import List
+from typing import Iterator, List
 from uuid import uuid4
 
 
@@ -94,47 +94,54 @@ class ConversationGenerator:
         }
     ]
 
+    # Templates per domain, built once at class creation
+    DOMAIN_TEMPLATES = {
+        "coding": tuple(CODING_CONVERSATIONS),
+        "music": tuple(MUSIC_CONVERSATIONS),
+        "blender": tuple(BLENDER_CONVERSATIONS),
+        "study": tuple(STUDY_CONVERSATIONS),
+        "general": tuple(GENERAL_CONVERSATIONS),
+    }
+
     @staticmethod
-    def generate_mock_conversations(
+    def iter_mock_conversations(
         count: int = 100,
         domains: List[str] = None,
-    ) -> List[dict]:
+    ) -> Iterator[dict]:
         """
-        Generate realistic mock conversations.
+        Lazily generate realistic mock conversations.
 
         Args:
             count: Total conversations to generate
             domains: Domains to include (default: all)
 
-        Returns:
-            List of conversation dicts ready for ingestion
+        Yields:
+            Conversation dicts ready for ingestion
         """
         if domains is None:
             domains = ["coding", "music", "blender", "study", "general"]
 
-        conversations = []
         now = datetime.now()
 
-        domain_map = {
-            "coding": ConversationGenerator.CODING_CONVERSATIONS,
-            "music": ConversationGenerator.MUSIC_CONVERSATIONS,
-            "blender": ConversationGenerator.BLENDER_CONVERSATIONS,
-            "study": ConversationGenerator.STUDY_CONVERSATIONS,
-            "general": ConversationGenerator.GENERAL_CONVERSATIONS,
-        }
+        domain_templates = [
+            ConversationGenerator.DOMAIN_TEMPLATES[domain] for domain in domains
+        ]
+
+        # Timestamps spread over last 6 months, formatted once per day
+        timestamps = [
+            (now - timedelta(days=days_ago)).isoformat() + "Z"
+            for days_ago in range(min(count, 180))
+        ]
 
         for i in range(count):
             # Distribute evenly across domains
             domain = domains[i % len(domains)]
-            template = domain_map[domain][i % len(domain_map[domain])]
-
-            # Generate timestamp (spread over last 6 months)
-            days_ago = i % 180
-            timestamp = (now - timedelta(days=days_ago)).isoformat() + "Z"
+            templates = domain_templates[i % len(domains)]
+            template = templates[i % len(templates)]
 
-            conversation = {
+            yield {
                 "id": f"conv_{uuid4().hex[:8]}",
-                "timestamp": timestamp,
+                "timestamp": timestamps[i % 180],
                 "participants": ["PlumbMonkey", "AI"],
                 "domain": domain,
                 "messages": [
@@ -144,9 +151,22 @@ class ConversationGenerator:
                 "tags": template["tags"],
             }
 
-            conversations.append(conversation)
+    @staticmethod
+    def generate_mock_conversations(
+        count: int = 100,
+        domains: List[str] = None,
+    ) -> List[dict]:
+        """
+        Generate realistic mock conversations.
 
-        return conversations
+        Args:
+            count: Total conversations to generate
+            domains: Domains to include (default: all)
+
+        Returns:
+            List of conversation dicts ready for ingestion
+        """
+        return list(ConversationGenerator.iter_mock_conversations(count, domains))
 
 
 def generate_mock_conversations(
@@ -157,6 +177,14 @@ def generate_mock_conversations(
     return ConversationGenerator.generate_mock_conversations(count, domains)
 
 
+def iter_mock_conversations(
+    count: int = 100,
+    domains: List[str] = None,
+) -> Iterator[dict]:
+    """Convenience function to lazily generate mock conversations."""
+    return ConversationGenerator.iter_mock_conversations(count, domains)
+
+
 def save_mock_data_as_json(filepath: str, count: int = 1000) -> None:
     """Save mock conversations to a JSON file for testing."""
     conversations = generate_mock_conversations(count)
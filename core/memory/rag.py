@@ -1,7 +1,9 @@
 """Retrieval-Augmented Generation (RAG) pipeline."""
 
 import logging
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 from core.memory.silos import CrossDomainQuery, DomainMemory
@@ -9,12 +11,28 @@ from core.memory.silos import CrossDomainQuery, DomainMemory
 logger = logging.getLogger(__name__)
 
 
+class _NoResults(Exception):
+    """Raised inside the query cache so empty results are not stored."""
+
+
 class AdvancedRAG:
     """Multi-stage retrieval pipeline with domain awareness."""
 
-    def __init__(self):
-        """Initialize RAG engine."""
+    def __init__(self, cache_size: int = 128, cache_ttl: int = 60):
+        """
+        Initialize RAG engine.
+
+        Args:
+            cache_size: Number of query results to keep (0 disables caching)
+            cache_ttl: Seconds a cached result is reused for
+        """
         self.cross_domain_query = CrossDomainQuery()
+        self.cache_ttl = max(cache_ttl, 1)
+
+        # Repeated questions are answered from here until a write in this
+        # process changes DomainMemory.version, or the TTL bucket rolls over
+        # (writes from other processes aren't seen by the version)
+        self._cached_query = lru_cache(maxsize=cache_size)(self._query_nonempty)
 
     def query(
         self,
@@ -39,6 +57,45 @@ class AdvancedRAG:
         """
         logger.debug(f"RAG query: {question[:100]}... (domain: {domain})")
 
+        try:
+            results = self._cached_query(
+                question,
+                domain,
+                top_k,
+                tuple(time_range) if time_range else None,
+                expand_domains,
+                (DomainMemory.version, int(time.time()) // self.cache_ttl),
+            )
+        except _NoResults:
+            return []
+        # Callers get their own dicts (and tag lists) to modify
+        return [{**result, "tags": list(result["tags"])} for result in results]
+
+    def clear_cache(self) -> None:
+        """Drop cached query results."""
+        self._cached_query.cache_clear()
+
+    def _query_nonempty(self, *args) -> tuple:
+        """_query_impl() as cached; empty results raise so they aren't kept.
+
+        Searches swallow errors as empty results, and lru_cache doesn't
+        store calls that raise.
+        """
+        results = self._query_impl(*args)
+        if not results:
+            raise _NoResults
+        return tuple(results)
+
+    def _query_impl(
+        self,
+        question: str,
+        domain: Optional[str],
+        top_k: int,
+        time_range: Optional[tuple],
+        expand_domains: bool,
+        cache_stamp: tuple,
+    ) -> List[dict]:
+        """Uncached query(); cache_stamp (memory version, TTL bucket) only keys the cache."""
         # Stage 1: Domain-filtered or cross-domain search
         if domain:
             results = self._search_domain(question, domain, top_k)
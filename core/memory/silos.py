@@ -1,6 +1,7 @@
 """Domain-specific memory silos with ChromaDB."""
 
 import logging
+import uuid
 from typing import List, Optional
 
 from core.config.settings import get_settings
@@ -15,6 +16,10 @@ class DomainMemory:
     # Valid domains
     VALID_DOMAINS = ["coding", "music", "blender", "study", "general"]
 
+    # Bumped on every write to any domain in this process, so query caches
+    # (see AdvancedRAG) can tell when their results may be stale
+    version = 0
+
     def __init__(self, domain: str):
         """
         Initialize domain memory.
@@ -39,36 +44,87 @@ class DomainMemory:
         Args:
             conversation: Normalized conversation dict with embedding
         """
-        # Extract content for storage
-        conv_id = conversation.get("id", "")
-        messages = conversation.get("messages", [])
-        timestamp = conversation.get("timestamp", "")
-        tags = conversation.get("tags", [])
-
-        # Combine all text for semantic search
-        text_content = " ".join(
-            msg.get("content", "") for msg in messages
-        )
-
-        if not text_content.strip():
-            logger.warning("Skipping conversation with no text content")
-            return
-
-        metadata = {
-            "domain": self.domain,
-            "timestamp": timestamp,
-            "tags": ",".join(tags),
-            "message_count": len(messages),
-        }
+        self.add_conversations([conversation])
 
-        # Store in vector store
-        self.vector_store.add_documents(
-            documents=[text_content],
-            metadatas=[metadata],
-            ids=[conv_id] if conv_id else None,
-        )
+    def add_conversations(self, conversations: List[dict]) -> int:
+        """
+        Add several conversations to domain memory in one vector store call.
+
+        Conversations without an id get a random one; a repeated id keeps
+        its first conversation. If the batch is rejected, each conversation
+        is retried on its own so one bad entry doesn't lose the rest.
 
-        logger.debug(f"Added conversation to {self.domain}_memory")
+        Args:
+            conversations: Normalized conversation dicts
+
+        Returns:
+            Number of conversations stored
+        """
+        documents = []
+        metadatas = []
+        ids = []
+        seen_ids = set()
+
+        for conversation in conversations:
+            # Extract content for storage
+            conv_id = conversation.get("id") or str(uuid.uuid4())
+            messages = conversation.get("messages", [])
+            timestamp = conversation.get("timestamp", "")
+            tags = conversation.get("tags", [])
+
+            if conv_id in seen_ids:
+                logger.warning(f"Skipping duplicate conversation id {conv_id}")
+                continue
+
+            # Combine all text for semantic search
+            text_content = " ".join(
+                msg.get("content", "") for msg in messages
+            )
+
+            if not text_content.strip():
+                logger.warning("Skipping conversation with no text content")
+                continue
+
+            seen_ids.add(conv_id)
+            documents.append(text_content)
+            metadatas.append({
+                "domain": self.domain,
+                "timestamp": timestamp,
+                "tags": ",".join(tags),
+                "message_count": len(messages),
+            })
+            ids.append(conv_id)
+
+        if not documents:
+            return 0
+
+        # Store in vector store
+        try:
+            self.vector_store.add_documents(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids,
+            )
+            stored = len(documents)
+        except Exception as e:
+            logger.warning(f"Batch add to {self.domain}_memory failed ({e}), adding one by one")
+            stored = 0
+            for document, metadata, conv_id in zip(documents, metadatas, ids):
+                try:
+                    self.vector_store.add_documents(
+                        documents=[document],
+                        metadatas=[metadata],
+                        ids=[conv_id],
+                    )
+                    stored += 1
+                except Exception as e:
+                    logger.error(f"Failed to store conversation {conv_id}: {e}")
+
+        if stored:
+            DomainMemory.version += 1
+
+        logger.debug(f"Added {stored} conversations to {self.domain}_memory")
+        return stored
 
     def query(
         self,
@@ -99,14 +155,15 @@ class DomainMemory:
     def clear(self) -> None:
         """Clear all data in this domain."""
         self.vector_store.clear()
+        DomainMemory.version += 1
         logger.info(f"Cleared {self.domain}_memory")
 
     def get_stats(self) -> dict:
         """Get statistics about this domain's memory."""
-        # TODO: Implement with ChromaDB collection stats
         return {
             "domain": self.domain,
             "collection": self.collection_name,
+            "total_documents": self.vector_store.get_collection_size(),
         }
 
 
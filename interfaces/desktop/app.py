@@ -8,11 +8,13 @@ Features: Chat with Gene, web search integration, business management.
 
 import customtkinter as ctk
 import threading
+import queue
 import requests
 import sys
 import os
 import re
 import json
+import tempfile
 from datetime import datetime
 from PIL import Image, ImageTk, ImageEnhance
 
@@ -204,6 +206,19 @@ class LocalAIAgentApp(ctk.CTk):
         self.current_session_id = None  # Current chat session ID
         self.session_title = None  # Auto-generated from first message
         
+        # Background session writer - holds at most one pending snapshot.
+        # Every write (queued or immediate) and every delete takes
+        # _session_lock; snapshots carry a sequence number so an older
+        # snapshot never overwrites a newer one, and deleted sessions are
+        # never written back.
+        self._save_queue = queue.Queue(maxsize=1)
+        self._session_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = {}
+        self._deleted_sessions = set()
+        threading.Thread(target=self._session_writer_loop, daemon=True).start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Business management
         self.business_handler = None
         if BUSINESS_AVAILABLE:
@@ -898,14 +913,20 @@ class LocalAIAgentApp(ctk.CTk):
             title += "..."
         return title
     
-    def _save_current_session(self):
-        """Save the current chat session to disk."""
+    def _build_session_data(self) -> tuple | None:
+        """Snapshot the current chat session for saving.
+        
+        Returns (sequence, session_data), or None if the chat is empty.
+        """
         if not self.conversation_history:
-            return  # Nothing to save
+            return None  # Nothing to save
         
         # Generate session ID if needed
         if not self.current_session_id:
             self.current_session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            with self._session_lock:
+                # A fresh chat may reuse the timestamp of a just-deleted one
+                self._deleted_sessions.discard(self.current_session_id)
         
         # Generate title from first user message if needed
         if not self.session_title:
@@ -916,23 +937,84 @@ class LocalAIAgentApp(ctk.CTk):
             if not self.session_title:
                 self.session_title = "Untitled Chat"
         
-        # Build session data
-        session_data = {
+        self._snapshot_seq += 1
+        return self._snapshot_seq, {
             "id": self.current_session_id,
             "title": self.session_title,
             "created": self.current_session_id,  # Timestamp is the ID
             "updated": datetime.now().strftime("%Y%m%d_%H%M%S"),
             "model": self.current_model,
-            "messages": self.conversation_history,
+            "messages": list(self.conversation_history),
         }
+    
+    def _write_session_file(self, session_id: str, seq: int, session_data: dict):
+        """Write session data to disk atomically (temp file + replace).
+        
+        Skips snapshots older than the last one written for the session and
+        sessions that have been deleted.
+        """
+        filepath = self._get_session_filename(session_id)
+        with self._session_lock:
+            if session_id in self._deleted_sessions:
+                return
+            if seq <= self._written_seq.get(session_id, 0):
+                return
+            tmp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=HISTORY_DIR,
+                    suffix=".tmp", delete=False,
+                ) as f:
+                    tmp_path = f.name
+                    json.dump(session_data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, filepath)
+                self._written_seq[session_id] = seq
+            except Exception as e:
+                print(f"Error saving session: {e}")
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    def _save_current_session(self):
+        """Save the current chat session to disk."""
+        snapshot = self._build_session_data()
+        if snapshot is None:
+            return
+        seq, session_data = snapshot
+        self._write_session_file(self.current_session_id, seq, session_data)
+    
+    def _queue_session_save(self):
+        """Queue the current session for the background writer (non-blocking).
         
-        # Save to file
-        filepath = self._get_session_filename(self.current_session_id)
+        Only the latest snapshot is kept - a pending older one is dropped.
+        """
+        snapshot = self._build_session_data()
+        if snapshot is None:
+            return
+        item = (self.current_session_id, *snapshot)
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving session: {e}")
+            self._save_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._save_queue.get_nowait()
+                self._save_queue.task_done()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait(item)
+    
+    def _session_writer_loop(self):
+        """Write queued session snapshots to disk (runs in background thread)."""
+        while True:
+            session_id, seq, session_data = self._save_queue.get()
+            try:
+                self._write_session_file(session_id, seq, session_data)
+            finally:
+                self._save_queue.task_done()
+    
+    def _on_close(self):
+        """Flush pending session saves, then close the window."""
+        self._save_queue.join()
+        self._save_current_session()
+        self.destroy()
     
     def _load_session(self, session_id: str):
         """Load a chat session from disk."""
@@ -1005,8 +1087,11 @@ class LocalAIAgentApp(ctk.CTk):
         """Delete a chat session."""
         filepath = self._get_session_filename(session_id)
         try:
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            with self._session_lock:
+                # Queued or later saves of this session must not recreate it
+                self._deleted_sessions.add(session_id)
+                if os.path.exists(filepath):
+                    os.remove(filepath)
             # If we deleted the current session, start fresh
             if session_id == self.current_session_id:
                 self._new_chat()
@@ -1648,8 +1733,8 @@ class LocalAIAgentApp(ctk.CTk):
         # Store full response in history
         self.conversation_history.append({"role": "assistant", "content": response})
         
-        # Auto-save session after each exchange
-        self._save_current_session()
+        # Auto-save session after each exchange (off the UI thread)
+        self._queue_session_save()
         
         # Re-enable input
         self._re_enable_inputs()
@@ -1752,17 +1837,8 @@ class LocalAIAgentApp(ctk.CTk):
                         # Names are likely consecutive capitalized words
                         primary_topics.append(lower)
         
-        # Build final topic list - primary topics first
-        final_topics = []
-        seen = set()
-        for t in primary_topics:
-            if t not in seen:
-                final_topics.append(t)
-                seen.add(t)
-        for t in topics:
-            if t not in seen:
-                final_topics.append(t)
-                seen.add(t)
+        # Build final topic list - primary topics first, deduplicated in order
+        final_topics = list(dict.fromkeys(primary_topics + list(topics)))
         
         # Update tracking - keep only top 6 topics (focused)
         self.recent_search_topics = final_topics[:6]
@@ -1836,11 +1912,22 @@ class LocalAIAgentApp(ctk.CTk):
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            # Stream the body and stop once we have enough markup to fill
+            # max_chars of text - large pages aren't downloaded in full
+            byte_limit = max_chars * 8
+            chunks = []
+            total = 0
+            with requests.get(url, headers=headers, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=16384):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= byte_limit:
+                        break
+                encoding = response.encoding or "utf-8"
             
             # Simple HTML to text extraction
-            html = response.text
+            html = b"".join(chunks).decode(encoding, errors="ignore")
             
             # Remove script and style elements
             html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
@@ -6,35 +6,615 @@ Stores and manages business data locally.
 import sqlite3
 import os
 import json
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import queue
+import re
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+# Faster JSON for tags/settings when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
 
 # Database file location
 DB_DIR = os.path.dirname(__file__)
 DB_PATH = os.path.join(DB_DIR, "business_data.db")
 
+# Per-connection tuning applied every time a connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # Safe with WAL, one fsync per checkpoint
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+# Authorizer actions allowed on read-only connections; anything else
+# (writes, DDL, PRAGMA, ATTACH, transactions) fails when prepared.
+READ_ACTIONS = frozenset((
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+))
+# FTS5 checks the data_version pragma when it opens its index
+READ_PRAGMAS = frozenset(("data_version",))
+
+
+def _read_only_authorizer(action: int, arg1, arg2, db_name, trigger) -> int:
+    """sqlite3 authorizer that only lets through statements that read."""
+    if action in READ_ACTIONS or (action == sqlite3.SQLITE_PRAGMA and arg1 in READ_PRAGMAS):
+        return sqlite3.SQLITE_OK
+    # Declaring a virtual table (FTS5 opening its index) is reported as an
+    # update of sqlite_master; user SQL can't modify it without writable_schema
+    if action == sqlite3.SQLITE_UPDATE and arg1 == "sqlite_master":
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
+# File-level layout. These only take effect when the file is created (or
+# rebuilt by VACUUM): larger pages suit the many small text rows, and
+# incremental auto-vacuum lets freed pages be reclaimed without a full VACUUM.
+STORAGE_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA auto_vacuum=INCREMENTAL",
+)
+PAGE_SIZE = 8192
+AUTO_VACUUM_INCREMENTAL = 2
+
+# Rows pulled from SQLite per fetchmany() call by the iter_* generators
+ITER_BATCH_SIZE = 1000
+
+# Bumped when an existing database needs a one-off upgrade; stored in
+# business_settings under "schema_version".
+SCHEMA_VERSION = 1
+
+
+# Full-text search indexes: table -> indexed columns
+FTS_INDEXES = {
+    "contacts": ("name", "company", "email", "notes"),
+    "products": ("name", "description", "sku", "category"),
+    "notes": ("title", "content"),
+}
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _fts_query(text: str) -> Optional[str]:
+    """Turn free text into a safe FTS5 MATCH expression.
+    
+    Each word becomes a quoted prefix term, so FTS operators in user input
+    are never interpreted and partial words still match.
+    """
+    tokens = _FTS_TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+# Fixed insert column order per table. Every insert binds all columns
+# (None when absent) so the SQL text never varies with the caller's kwargs.
+CONTACT_COLS = ("name", "company", "email", "phone", "address", "type_id", "notes", "tags")
+# Caller-facing contact fields ("type" is stored as contacts.type_id)
+CONTACT_FIELDS = ("name", "company", "email", "phone", "address", "type", "notes", "tags")
+PRODUCT_COLS = ("name", "description", "sku", "price", "cost", "category", "type",
+                "stock_quantity", "unit", "active", "tags")
+INVOICE_COLS = ("invoice_number", "contact_id", "type", "status", "subtotal", "tax_rate",
+                "tax_amount", "total", "currency", "issue_date", "due_date", "notes")
+TASK_COLS = ("title", "description", "project_id", "contact_id", "status", "priority",
+             "due_date", "tags")
+NOTE_COLS = ("title", "content", "category", "contact_id", "project_id", "tags")
+
+
+def _insert_sql(table: str, cols: tuple, defaults: Dict[str, str] = None) -> str:
+    """Build a fixed INSERT returning the new ID.
+    
+    Columns with a default fall back to it when bound NULL.
+    """
+    defaults = defaults or {}
+    placeholders = ", ".join(
+        f"COALESCE(?, {defaults[col]})" if col in defaults else "?" for col in cols
+    )
+    return f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders}) RETURNING id"
+
+
+CONTACT_INSERT = _insert_sql("contacts", CONTACT_COLS, {"type_id": "1"})
+PRODUCT_INSERT = _insert_sql("products", PRODUCT_COLS, {
+    "type": "'product'", "stock_quantity": "0", "unit": "'each'", "active": "1",
+})
+INVOICE_INSERT = _insert_sql("invoices", INVOICE_COLS, {
+    "type": "'invoice'", "status": "'draft'", "subtotal": "0", "tax_rate": "0",
+    "tax_amount": "0", "total": "0", "currency": "'USD'",
+})
+TASK_INSERT = _insert_sql("tasks", TASK_COLS, {"status": "'todo'", "priority": "'medium'"})
+NOTE_INSERT = _insert_sql("notes", NOTE_COLS)
+
+# Full row shape returned by the list_* queries, for the *_json variants
+CONTACT_JSON_COLS = ("id",) + CONTACT_FIELDS + ("created_at", "updated_at")
+PRODUCT_JSON_COLS = ("id",) + PRODUCT_COLS + ("created_at", "updated_at")
+INVOICE_JSON_COLS = ("id",) + INVOICE_COLS + ("paid_date", "created_at", "updated_at",
+                                              "contact_name")
+TASK_JSON_COLS = ("id",) + TASK_COLS + ("completed_at", "priority_rank", "created_at",
+                                        "updated_at")
+NOTE_JSON_COLS = ("id",) + NOTE_COLS + ("created_at", "updated_at")
+
+# Contacts joined back to their type name, in the original column order
+CONTACT_SELECT = """
+    SELECT c.id, c.name, c.company, c.email, c.phone, c.address, t.name AS type,
+           c.notes, c.tags, c.created_at, c.updated_at
+    FROM contacts c
+    LEFT JOIN contact_types t ON t.id = c.type_id
+"""
+CONTACT_TYPE_FILTER = "c.type_id = (SELECT id FROM contact_types WHERE name = ?)"
+
+# Built-in contact types; other names are added on first use
+CONTACT_TYPES = ((1, "contact"), (2, "client"), (3, "vendor"), (4, "lead"))
+CONTACT_TYPES_TABLE = """
+    CREATE TABLE IF NOT EXISTS contact_types (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    ) STRICT
+"""
+
+# Sortable rank for task priority text (lower = more urgent)
+PRIORITY_RANK_SQL = (
+    "CASE {} WHEN 'urgent' THEN 1 WHEN 'high' THEN 2 WHEN 'medium' THEN 3 ELSE 4 END"
+)
+
+# Partial update: a NULL parameter keeps the current value
+CONTACT_UPDATE = (
+    f"UPDATE contacts SET {', '.join(f'{col} = COALESCE(?, {col})' for col in CONTACT_COLS)}, "
+    "updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Query text, built once at import so every call reuses the same string
+# (and so sqlite3's per-connection statement cache)
+# ─────────────────────────────────────────────────────────────────────────────
+
+CONTACT_GET = CONTACT_SELECT + " WHERE c.id = ?"
+CONTACT_SEARCH = CONTACT_SELECT + """
+    JOIN contacts_fts f ON f.rowid = c.id
+    WHERE contacts_fts MATCH ?
+    ORDER BY bm25(contacts_fts), c.name
+"""
+CONTACT_SEARCH_BY_TYPE = CONTACT_SELECT + f"""
+    JOIN contacts_fts f ON f.rowid = c.id
+    WHERE contacts_fts MATCH ? AND {CONTACT_TYPE_FILTER}
+    ORDER BY bm25(contacts_fts), c.name
+"""
+CONTACT_LIST = CONTACT_SELECT + " ORDER BY c.name LIMIT ?"
+CONTACT_LIST_BY_TYPE = CONTACT_SELECT + f" WHERE {CONTACT_TYPE_FILTER} ORDER BY c.name LIMIT ?"
+CONTACT_COUNT_BY_TYPE = """
+    SELECT t.name, COUNT(*) FROM contacts c
+    LEFT JOIN contact_types t ON t.id = c.type_id
+    GROUP BY c.type_id
+"""
+
+PRODUCT_SEARCH = """
+    SELECT p.* FROM products p
+    JOIN products_fts f ON f.rowid = p.id
+    WHERE products_fts MATCH ? AND p.active = 1
+    ORDER BY bm25(products_fts), p.name
+"""
+PRODUCT_LIST = "SELECT * FROM products WHERE active = 1 ORDER BY name LIMIT ?"
+PRODUCT_LIST_BY_CATEGORY = (
+    "SELECT * FROM products WHERE category = ? AND active = 1 ORDER BY name LIMIT ?"
+)
+PRODUCT_COUNT = "SELECT COUNT(*) FROM products WHERE active = 1"
+
+INVOICE_ITEM_INSERT = """
+    INSERT INTO invoice_items (invoice_id, product_id, description, quantity, unit_price, total)
+    VALUES (?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+INVOICE_SELECT = """
+    SELECT i.*, c.name as contact_name
+    FROM invoices i
+    LEFT JOIN contacts c ON i.contact_id = c.id
+"""
+INVOICE_LIST = INVOICE_SELECT + " ORDER BY i.created_at DESC LIMIT ?"
+INVOICE_LIST_BY_STATUS = INVOICE_SELECT + " WHERE i.status = ? ORDER BY i.created_at DESC LIMIT ?"
+
+
+def _task_list_sql(by_status: bool, by_priority: bool) -> str:
+    """Build the list_tasks query for one combination of filters."""
+    filters = [f for f, on in (("status = ?", by_status), ("priority = ?", by_priority)) if on]
+    where = f" WHERE {' AND '.join(filters)}" if filters else ""
+    return f"SELECT * FROM tasks{where} ORDER BY priority_rank, due_date LIMIT ?"
+
+
+# Keyed by (filter on status, filter on priority)
+TASK_LIST = {
+    (by_status, by_priority): _task_list_sql(by_status, by_priority)
+    for by_status in (False, True)
+    for by_priority in (False, True)
+}
+TASK_COMPLETE = """
+    UPDATE tasks 
+    SET status = 'done', completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+TASK_COUNT_BY_STATUS_PRIORITY = "SELECT status, priority, COUNT(*) FROM tasks GROUP BY status, priority"
+
+NOTE_SEARCH = """
+    SELECT n.* FROM notes n
+    JOIN notes_fts f ON f.rowid = n.id
+    WHERE notes_fts MATCH ?
+    ORDER BY bm25(notes_fts), n.updated_at DESC
+"""
+NOTE_LIST = "SELECT * FROM notes ORDER BY updated_at DESC LIMIT ?"
+NOTE_LIST_BY_CATEGORY = "SELECT * FROM notes WHERE category = ? ORDER BY updated_at DESC LIMIT ?"
+
+SETTING_SET = """
+    INSERT OR REPLACE INTO business_settings (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+"""
+SETTING_GET = "SELECT value FROM business_settings WHERE key = ?"
+
+
+@lru_cache(maxsize=None)
+def _json_array_sql(cols: tuple, sql: str) -> str:
+    """Wrap a SELECT so SQLite returns its rows as one JSON array."""
+    obj = ", ".join(f"'{col}', {col}" for col in cols)
+    return f"SELECT json_group_array(json_object({obj})) FROM ({sql})"
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """Fetch all rows as dicts, reading the column names only once."""
+    cols = tuple(d[0] for d in cursor.description)
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+def _tags_value(fields: Dict) -> Optional[str]:
+    """Serialize the optional tags list for storage."""
+    return _dumps(fields["tags"]) if "tags" in fields else None
+
+
+def _contact_row(name: str, fields: Dict, type_id: Optional[int]) -> tuple:
+    """Normalize contact fields to CONTACT_COLS order."""
+    return (name, fields.get("company"), fields.get("email"), fields.get("phone"),
+            fields.get("address"), type_id, fields.get("notes"), _tags_value(fields))
+
+
+def _product_row(name: str, fields: Dict) -> tuple:
+    """Normalize product fields to PRODUCT_COLS order."""
+    return (name, fields.get("description"), fields.get("sku"), fields.get("price"),
+            fields.get("cost"), fields.get("category"), fields.get("type"),
+            fields.get("stock_quantity"), fields.get("unit"), fields.get("active"),
+            _tags_value(fields))
+
+
+def _task_row(title: str, fields: Dict) -> tuple:
+    """Normalize task fields to TASK_COLS order."""
+    return (title, fields.get("description"), fields.get("project_id"), fields.get("contact_id"),
+            fields.get("status"), fields.get("priority"), fields.get("due_date"),
+            _tags_value(fields))
+
+
+def _note_row(title: str, content: str, fields: Dict) -> tuple:
+    """Normalize note fields to NOTE_COLS order."""
+    return (title, content, fields.get("category"), fields.get("contact_id"),
+            fields.get("project_id"), _tags_value(fields))
+
+
+def _invoice_row(invoice_number: Optional[str], contact_id: Optional[int], fields: Dict) -> tuple:
+    """Normalize invoice fields to INVOICE_COLS order."""
+    return (invoice_number, contact_id, fields.get("type"), fields.get("status"),
+            fields.get("subtotal"), fields.get("tax_rate"), fields.get("tax_amount"),
+            fields.get("total"), fields.get("currency"), fields.get("issue_date"),
+            fields.get("due_date"), fields.get("notes"))
+
+
+def _invoice_item_row(invoice_id: int, item: Dict) -> tuple:
+    """Normalize an invoice line item; total defaults to quantity * unit_price."""
+    quantity = item.get("quantity", 1)
+    unit_price = item.get("unit_price", 0)
+    total = item.get("total", quantity * unit_price)
+    return (invoice_id, item.get("product_id"), item.get("description"), quantity, unit_price, total)
+
 
 class BusinessDatabase:
     """SQLite database for business data management."""
     
     def __init__(self, db_path: str = DB_PATH):
         self.db_path = db_path
+        self._in_memory = db_path == ":memory:"
+        self._read_only_uri = None if self._in_memory else Path(db_path).absolute().as_uri() + "?mode=ro"
+        
+        # Connection pool: one writer (serialized by a lock) + N read-only readers
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._pool_size = os.cpu_count() or 4
+        self._readers: queue.Queue = queue.Queue(maxsize=self._pool_size)
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        
+        # Bumped after every committed write, so callers can cache reads
+        self.version = 0
+        
+        # Contact type IDs added in the open write transaction; merged into
+        # _contact_type_ids on commit and dropped on rollback
+        self._pending_type_ids: Dict[str, int] = {}
+        
         self._init_database()
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a new tuned database connection.
+        
+        Read-only connections are opened with a mode=ro URI, so SQLite itself
+        rejects any write that reaches them, and get an authorizer that
+        refuses anything but reads when a statement is prepared.
+        """
+        if read_only:
+            conn = sqlite3.connect(
+                self._read_only_uri, uri=True, check_same_thread=False, cached_statements=256
+            )
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
         conn.row_factory = sqlite3.Row  # Return rows as dicts
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.set_authorizer(_read_only_authorizer)
         return conn
     
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take a reader from the pool, opening one if the pool isn't full."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self._reader_count < self._pool_size:
+                self._reader_count += 1
+                return self._connect(read_only=True)
+        return self._readers.get()
+    
+    @contextmanager
+    def _conn(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection.
+        
+        Writes go through the single writer connection and are committed on
+        exit (rolled back on error). Reads use the read-only pool. An in-memory
+        database only exists on one connection, so everything uses the writer.
+        """
+        if write or self._in_memory:
+            with self._write_lock:
+                if self._write_conn is None:
+                    self._write_conn = self._connect()
+                conn = self._write_conn
+                try:
+                    yield conn
+                    conn.commit()
+                    if write:
+                        self.version += 1
+                except BaseException:
+                    conn.rollback()
+                    self._pending_type_ids.clear()
+                    raise
+                self._contact_type_ids.update(self._pending_type_ids)
+                self._pending_type_ids.clear()
+            return
+        
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close all pooled connections."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                self._write_conn.execute("PRAGMA optimize")
+                self._write_conn.close()
+                self._write_conn = None
+        with self._pool_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._reader_count = 0
+    
+    def _insert_many(self, sql: str, rows: List) -> List[int]:
+        """Insert rows in one transaction and return their new IDs in order."""
+        if not rows:
+            return []
+        with self._conn(write=True) as conn:
+            # Take the write lock up front rather than escalating mid-batch
+            conn.execute("BEGIN IMMEDIATE")
+            return self._executemany_ids(conn, sql, rows)
+    
+    @staticmethod
+    def _executemany_ids(conn: sqlite3.Connection, sql: str, rows: List) -> List[int]:
+        """Insert rows on conn and return their new IDs in order."""
+        conn.executemany(sql, rows)
+        # AUTOINCREMENT IDs are sequential within a single-writer transaction
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+    
+    def _query_json(self, cols: tuple, sql: str, params) -> bytes:
+        """Run a SELECT and have SQLite serialize the rows to a JSON array."""
+        with self._conn() as conn:
+            return conn.execute(_json_array_sql(cols, sql), params).fetchone()[0].encode()
+    
+    def _iter_rows(self, sql: str, params) -> Iterator[Dict]:
+        """Yield rows as dicts, fetching them from SQLite in batches.
+        
+        The caller may use this instance while iterating, so no pooled
+        connection is held across yields. An in-memory database only has the
+        writer connection, so its rows are fetched up front under the lock.
+        Otherwise the rows stream from a read-only connection of their own,
+        closed when the generator is exhausted or closed.
+        """
+        if self._in_memory:
+            with self._conn() as conn:
+                cursor = conn.execute(sql, params)
+                cols = tuple(d[0] for d in cursor.description)
+                rows = cursor.fetchall()
+            for row in rows:
+                yield dict(zip(cols, row))
+            return
+        
+        conn = self._connect(read_only=True)
+        try:
+            cursor = conn.execute(sql, params)
+            cursor.arraysize = ITER_BATCH_SIZE
+            cols = tuple(d[0] for d in cursor.description)
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(cols, row))
+        finally:
+            conn.close()
+    
     def _init_database(self):
         """Initialize database tables."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._conn(write=True) as conn:
+            self._migrate_contact_types(conn)
+            self._create_schema(conn.cursor())
+            self._contact_type_ids = {
+                name: type_id for type_id, name in conn.execute("SELECT id, name FROM contact_types")
+            }
+            conn.commit()
+            self._upgrade_storage(conn)
+    
+    def _upgrade_storage(self, conn: sqlite3.Connection):
+        """Rebuild a database created before STORAGE_PRAGMAS (one-off).
+        
+        page_size can't change in WAL mode, so the file is switched back to a
+        rollback journal for the VACUUM and then returned to WAL.
+        """
+        row = conn.execute(SETTING_GET, ("schema_version",)).fetchone()
+        if row and int(row[0]) >= SCHEMA_VERSION:
+            return
+        
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if not self._in_memory and (page_size, auto_vacuum) != (PAGE_SIZE, AUTO_VACUUM_INCREMENTAL):
+            conn.execute("PRAGMA journal_mode=DELETE")
+            for pragma in STORAGE_PRAGMAS:
+                conn.execute(pragma)
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA journal_mode=WAL")
+        
+        conn.execute(SETTING_SET, ("schema_version", str(SCHEMA_VERSION)))
+    
+    def vacuum_incremental(self, pages: int = 1000) -> int:
+        """Return up to `pages` free pages to the filesystem.
+        
+        Returns the number of free pages left afterwards.
+        """
+        with self._conn(write=True) as conn:
+            # Pragma arguments can't be bound; every step frees more pages
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+            return conn.execute("PRAGMA freelist_count").fetchone()[0]
+    
+    @staticmethod
+    def _migrate_contact_types(conn: sqlite3.Connection):
+        """Move contacts.type text into the contact_types lookup (one-off).
+        
+        SQLite can't change a column in place, so the table is rebuilt with
+        IDs preserved. Foreign keys are off while the old table is dropped.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(contacts)")}
+        if "type" not in columns:
+            return
+        
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            conn.execute("BEGIN")
+            conn.execute(CONTACT_TYPES_TABLE)
+            conn.executemany("INSERT OR IGNORE INTO contact_types (id, name) VALUES (?, ?)", CONTACT_TYPES)
+            conn.execute("""
+                INSERT OR IGNORE INTO contact_types (name)
+                SELECT DISTINCT type FROM contacts WHERE type IS NOT NULL
+            """)
+            conn.execute("""
+                CREATE TABLE contacts_new (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    company TEXT,
+                    email TEXT,
+                    phone TEXT,
+                    address TEXT,
+                    type_id INTEGER DEFAULT 1 REFERENCES contact_types(id),
+                    notes TEXT,
+                    tags TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute("""
+                INSERT INTO contacts_new (id, name, company, email, phone, address, type_id,
+                                          notes, tags, created_at, updated_at)
+                SELECT c.id, c.name, c.company, c.email, c.phone, c.address, t.id,
+                       c.notes, c.tags, c.created_at, c.updated_at
+                FROM contacts c
+                LEFT JOIN contact_types t ON t.name = c.type
+            """)
+            conn.execute("DROP TABLE contacts")
+            conn.execute("ALTER TABLE contacts_new RENAME TO contacts")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+    
+    def _contact_type_id(self, conn: sqlite3.Connection, name: Optional[str]) -> Optional[int]:
+        """Resolve a contact type name to its ID, adding unknown names.
+        
+        Must be called on the writer connection inside _conn(write=True);
+        a name added here is only cached once that transaction commits.
+        """
+        if name is None:
+            return None
+        type_id = self._contact_type_ids.get(name) or self._pending_type_ids.get(name)
+        if type_id is None:
+            type_id = conn.execute("""
+                INSERT INTO contact_types (name) VALUES (?)
+                ON CONFLICT (name) DO UPDATE SET name = excluded.name
+                RETURNING id
+            """, (name,)).fetchone()[0]
+            self._pending_type_ids[name] = type_id
+        return type_id
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables on a fresh database."""
+        
+        # Must precede the first table, and WAL, to apply on file creation
+        for pragma in STORAGE_PRAGMAS:
+            cursor.execute(pragma)
+        
+        # WAL is persistent in the file, so it only needs setting once.
+        # Readers no longer block behind writers and commits are appends.
+        if self.db_path != ":memory:":
+            cursor.execute("PRAGMA journal_mode=WAL")
         
         # ─────────────────────────────────────────────────────────────────────
         # Contacts / Clients
         # ─────────────────────────────────────────────────────────────────────
+        cursor.execute(CONTACT_TYPES_TABLE)
+        cursor.executemany("INSERT OR IGNORE INTO contact_types (id, name) VALUES (?, ?)", CONTACT_TYPES)
+        
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS contacts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -43,7 +623,7 @@ class BusinessDatabase:
                 email TEXT,
                 phone TEXT,
                 address TEXT,
-                type TEXT DEFAULT 'contact',  -- contact, client, vendor, lead
+                type_id INTEGER DEFAULT 1 REFERENCES contact_types(id),  -- contact, client, ...
                 notes TEXT,
                 tags TEXT,  -- JSON array of tags
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
@@ -146,11 +726,34 @@ class BusinessDatabase:
                 tags TEXT,  -- JSON array
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                 updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                priority_rank INTEGER,  -- 1=urgent .. 4=low, maintained by triggers
                 FOREIGN KEY (project_id) REFERENCES projects(id),
                 FOREIGN KEY (contact_id) REFERENCES contacts(id)
             )
         """)
         
+        # Databases created before priority_rank existed
+        cursor.execute("PRAGMA table_info(tasks)")
+        if "priority_rank" not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN priority_rank INTEGER")
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tasks_priority_rank_ai AFTER INSERT ON tasks BEGIN
+                UPDATE tasks SET priority_rank = {PRIORITY_RANK_SQL.format("NEW.priority")}
+                WHERE id = NEW.id;
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS tasks_priority_rank_au AFTER UPDATE OF priority ON tasks BEGIN
+                UPDATE tasks SET priority_rank = {PRIORITY_RANK_SQL.format("NEW.priority")}
+                WHERE id = NEW.id;
+            END
+        """)
+        cursor.execute(
+            f"UPDATE tasks SET priority_rank = {PRIORITY_RANK_SQL.format('priority')} "
+            "WHERE priority_rank IS NULL"
+        )
+        
         # ─────────────────────────────────────────────────────────────────────
         # Notes / Documents
         # ─────────────────────────────────────────────────────────────────────
@@ -181,8 +784,72 @@ class BusinessDatabase:
             )
         """)
         
-        conn.commit()
-        conn.close()
+        # ─────────────────────────────────────────────────────────────────────
+        # Indexes for list_* filters/sorts and dashboard counts
+        # ─────────────────────────────────────────────────────────────────────
+        for index_sql in [
+            "CREATE INDEX IF NOT EXISTS idx_contacts_type_name ON contacts(type_id, name)",
+            "CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name)",
+            "CREATE INDEX IF NOT EXISTS idx_products_active_category_name ON products(active, category, name)",
+            "CREATE INDEX IF NOT EXISTS idx_invoices_status_created ON invoices(status, created_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_invoices_created ON invoices(created_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_invoices_contact ON invoices(contact_id)",
+            "CREATE INDEX IF NOT EXISTS idx_invoice_items_invoice ON invoice_items(invoice_id)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_priority_due ON tasks(status, priority, due_date)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status_prio_due ON tasks(status, priority_rank, due_date)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_prio_due ON tasks(priority_rank, due_date)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_urgent_open ON tasks(priority) WHERE status != 'done'",
+            "CREATE INDEX IF NOT EXISTS idx_notes_category_updated ON notes(category, updated_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_notes_updated ON notes(updated_at DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_projects_status ON projects(status)",
+        ]:
+            cursor.execute(index_sql)
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # Full-text search
+        # ─────────────────────────────────────────────────────────────────────
+        for table, columns in FTS_INDEXES.items():
+            self._create_fts_index(cursor, table, columns)
+        
+        # Refresh query planner statistics for the schema
+        cursor.execute("PRAGMA optimize")
+    
+    @staticmethod
+    def _create_fts_index(cursor: sqlite3.Cursor, table: str, columns: tuple):
+        """Create an external-content FTS5 index kept in sync by triggers."""
+        fts = f"{table}_fts"
+        cols = ", ".join(columns)
+        new_cols = ", ".join(f"new.{c}" for c in columns)
+        old_cols = ", ".join(f"old.{c}" for c in columns)
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (fts,))
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts}
+            USING fts5({cols}, content='{table}', content_rowid='id')
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_cols});
+            END
+        """)
+        
+        # Index rows that existed before the FTS table did
+        if not exists:
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Contact Management
@@ -190,119 +857,92 @@ class BusinessDatabase:
     
     def add_contact(self, name: str, **kwargs) -> int:
         """Add a new contact."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        fields = ["name"]
-        values = [name]
-        
-        for key in ["company", "email", "phone", "address", "type", "notes"]:
-            if key in kwargs:
-                fields.append(key)
-                values.append(kwargs[key])
-        
-        if "tags" in kwargs:
-            fields.append("tags")
-            values.append(json.dumps(kwargs["tags"]))
-        
-        placeholders = ", ".join(["?" for _ in values])
-        field_names = ", ".join(fields)
-        
-        cursor.execute(f"INSERT INTO contacts ({field_names}) VALUES ({placeholders})", values)
-        contact_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return contact_id
+        with self._conn(write=True) as conn:
+            type_id = self._contact_type_id(conn, kwargs.get("type"))
+            return conn.execute(
+                CONTACT_INSERT, _contact_row(name, kwargs, type_id)
+            ).fetchone()[0]
+    
+    def add_contacts_bulk(self, rows: List[Dict]) -> List[int]:
+        """Add many contacts in a single transaction. Each dict needs a "name"."""
+        if not rows:
+            return []
+        with self._conn(write=True) as conn:
+            # New contact types are added in the same transaction as the rows
+            conn.execute("BEGIN IMMEDIATE")
+            type_ids = {t: self._contact_type_id(conn, t) for t in {row.get("type") for row in rows}}
+            return self._executemany_ids(
+                conn,
+                CONTACT_INSERT,
+                [_contact_row(row["name"], row, type_ids[row.get("type")]) for row in rows]
+            )
     
     def get_contact(self, contact_id: int) -> Optional[Dict]:
         """Get a contact by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._conn() as conn:
+            row = conn.execute(CONTACT_GET, (contact_id,)).fetchone()
         return dict(row) if row else None
     
     def search_contacts(self, query: str, contact_type: str = None) -> List[Dict]:
-        """Search contacts by name, company, or email."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        sql = """
-            SELECT * FROM contacts 
-            WHERE (name LIKE ? OR company LIKE ? OR email LIKE ? OR notes LIKE ?)
-        """
-        params = [f"%{query}%"] * 4
+        """Search contacts by name, company, email, or notes."""
+        match = _fts_query(query)
+        if not match:
+            return []
         
         if contact_type:
-            sql += " AND type = ?"
-            params.append(contact_type)
-        
-        sql += " ORDER BY name"
+            sql, params = CONTACT_SEARCH_BY_TYPE, (match, contact_type)
+        else:
+            sql, params = CONTACT_SEARCH, (match,)
         
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    @staticmethod
+    def _list_contacts_query(contact_type: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for list_contacts."""
+        if contact_type:
+            return CONTACT_LIST_BY_TYPE, (contact_type, limit)
+        return CONTACT_LIST, (limit,)
     
     def list_contacts(self, contact_type: str = None, limit: int = 50) -> List[Dict]:
         """List all contacts."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        if contact_type:
-            cursor.execute(
-                "SELECT * FROM contacts WHERE type = ? ORDER BY name LIMIT ?",
-                (contact_type, limit)
-            )
-        else:
-            cursor.execute("SELECT * FROM contacts ORDER BY name LIMIT ?", (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        sql, params = self._list_contacts_query(contact_type, limit)
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    def list_contacts_json(self, contact_type: str = None, limit: int = 50) -> bytes:
+        """List contacts as a UTF-8 JSON array, serialized by SQLite."""
+        sql, params = self._list_contacts_query(contact_type, limit)
+        return self._query_json(CONTACT_JSON_COLS, sql, params)
+    
+    def iter_contacts(self, contact_type: str = None, limit: int = -1) -> Iterator[Dict]:
+        """Stream contacts one at a time (no limit by default), for large exports."""
+        sql, params = self._list_contacts_query(contact_type, limit)
+        return self._iter_rows(sql, params)
+    
+    def count_contacts_by_type(self) -> Dict[str, int]:
+        """Count contacts per type name, e.g. {"client": 3, "vendor": 1}."""
+        with self._conn() as conn:
+            return dict(conn.execute(CONTACT_COUNT_BY_TYPE).fetchall())
     
     def update_contact(self, contact_id: int, **kwargs) -> bool:
-        """Update a contact."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        updates = []
-        values = []
-        
-        for key in ["name", "company", "email", "phone", "address", "type", "notes"]:
-            if key in kwargs:
-                updates.append(f"{key} = ?")
-                values.append(kwargs[key])
-        
-        if "tags" in kwargs:
-            updates.append("tags = ?")
-            values.append(json.dumps(kwargs["tags"]))
-        
-        if not updates:
-            conn.close()
+        """Update a contact. Fields left out (or passed as None) are unchanged."""
+        if not any(field in kwargs for field in CONTACT_FIELDS):
             return False
         
-        updates.append("updated_at = ?")
-        values.append(datetime.now().isoformat())
-        values.append(contact_id)
-        
-        cursor.execute(f"UPDATE contacts SET {', '.join(updates)} WHERE id = ?", values)
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
-        return success
+        with self._conn(write=True) as conn:
+            type_id = self._contact_type_id(conn, kwargs.get("type"))
+            values = _contact_row(kwargs.get("name"), kwargs, type_id) + (contact_id,)
+            cursor = conn.execute(CONTACT_UPDATE, values)
+            return cursor.rowcount > 0
     
     def delete_contact(self, contact_id: int) -> bool:
         """Delete a contact."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
-        return success
+        with self._conn(write=True) as conn:
+            cursor = conn.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+            return cursor.rowcount > 0
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Product Management
@@ -310,64 +950,53 @@ class BusinessDatabase:
     
     def add_product(self, name: str, **kwargs) -> int:
         """Add a new product or service."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        fields = ["name"]
-        values = [name]
-        
-        for key in ["description", "sku", "price", "cost", "category", "type", 
-                    "stock_quantity", "unit", "active"]:
-            if key in kwargs:
-                fields.append(key)
-                values.append(kwargs[key])
-        
-        if "tags" in kwargs:
-            fields.append("tags")
-            values.append(json.dumps(kwargs["tags"]))
-        
-        placeholders = ", ".join(["?" for _ in values])
-        field_names = ", ".join(fields)
-        
-        cursor.execute(f"INSERT INTO products ({field_names}) VALUES ({placeholders})", values)
-        product_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return product_id
+        with self._conn(write=True) as conn:
+            return conn.execute(PRODUCT_INSERT, _product_row(name, kwargs)).fetchone()[0]
+    
+    def add_products_bulk(self, rows: List[Dict]) -> List[int]:
+        """Add many products in a single transaction. Each dict needs a "name"."""
+        return self._insert_many(
+            PRODUCT_INSERT, [_product_row(row["name"], row) for row in rows]
+        )
     
     def search_products(self, query: str) -> List[Dict]:
-        """Search products by name, description, or SKU."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM products 
-            WHERE (name LIKE ? OR description LIKE ? OR sku LIKE ? OR category LIKE ?)
-            AND active = 1
-            ORDER BY name
-        """, (f"%{query}%",) * 4)
-        
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        """Search products by name, description, SKU, or category."""
+        match = _fts_query(query)
+        if not match:
+            return []
+        
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(PRODUCT_SEARCH, (match,)))
+        return rows
+    
+    @staticmethod
+    def _list_products_query(category: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for list_products."""
+        if category:
+            return PRODUCT_LIST_BY_CATEGORY, (category, limit)
+        return PRODUCT_LIST, (limit,)
     
     def list_products(self, category: str = None, limit: int = 50) -> List[Dict]:
         """List all products."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        if category:
-            cursor.execute(
-                "SELECT * FROM products WHERE category = ? AND active = 1 ORDER BY name LIMIT ?",
-                (category, limit)
-            )
-        else:
-            cursor.execute("SELECT * FROM products WHERE active = 1 ORDER BY name LIMIT ?", (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        sql, params = self._list_products_query(category, limit)
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    def list_products_json(self, category: str = None, limit: int = 50) -> bytes:
+        """List products as a UTF-8 JSON array, serialized by SQLite."""
+        sql, params = self._list_products_query(category, limit)
+        return self._query_json(PRODUCT_JSON_COLS, sql, params)
+    
+    def iter_products(self, category: str = None, limit: int = -1) -> Iterator[Dict]:
+        """Stream products one at a time (no limit by default), for large exports."""
+        sql, params = self._list_products_query(category, limit)
+        return self._iter_rows(sql, params)
+    
+    def count_products(self) -> int:
+        """Count active products."""
+        with self._conn() as conn:
+            return conn.execute(PRODUCT_COUNT).fetchone()[0]
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Invoice Management
@@ -375,123 +1004,108 @@ class BusinessDatabase:
     
     def create_invoice(self, contact_id: int = None, **kwargs) -> int:
         """Create a new invoice."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        # Generate invoice number
-        cursor.execute("SELECT COUNT(*) FROM invoices")
-        count = cursor.fetchone()[0]
-        invoice_number = kwargs.get("invoice_number", f"INV-{count + 1001:05d}")
-        
-        fields = ["invoice_number"]
-        values = [invoice_number]
-        
-        if contact_id:
-            fields.append("contact_id")
-            values.append(contact_id)
-        
-        for key in ["type", "status", "subtotal", "tax_rate", "tax_amount", 
-                    "total", "currency", "issue_date", "due_date", "notes"]:
-            if key in kwargs:
-                fields.append(key)
-                values.append(kwargs[key])
-        
-        placeholders = ", ".join(["?" for _ in values])
-        field_names = ", ".join(fields)
-        
-        cursor.execute(f"INSERT INTO invoices ({field_names}) VALUES ({placeholders})", values)
-        invoice_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return invoice_id
+        with self._conn(write=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            invoice_number = kwargs.get("invoice_number")
+            values = _invoice_row(invoice_number, contact_id or None, kwargs)
+            invoice_id = cursor.execute(INVOICE_INSERT, values).fetchone()[0]
+            
+            # Number the invoice from its row ID in the same transaction
+            if invoice_number is None:
+                cursor.execute(
+                    "UPDATE invoices SET invoice_number = printf('INV-%05d', id + 1000) WHERE id = ?",
+                    (invoice_id,)
+                )
+            return invoice_id
     
     def get_invoice(self, invoice_id: int) -> Optional[Dict]:
         """Get an invoice with items."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT i.*, c.name as contact_name, c.company as contact_company
-            FROM invoices i
-            LEFT JOIN contacts c ON i.contact_id = c.id
-            WHERE i.id = ?
-        """, (invoice_id,))
-        
-        invoice_row = cursor.fetchone()
-        if not invoice_row:
-            conn.close()
+        with self._conn() as conn:
+            cursor = conn.execute("""
+                SELECT i.*, c.name as contact_name, c.company as contact_company,
+                    (SELECT json_group_array(json_object(
+                        'id', ii.id, 'invoice_id', ii.invoice_id, 'product_id', ii.product_id,
+                        'description', ii.description, 'quantity', ii.quantity,
+                        'unit_price', ii.unit_price, 'total', ii.total, 'product_name', p.name))
+                     FROM invoice_items ii
+                     LEFT JOIN products p ON ii.product_id = p.id
+                     WHERE ii.invoice_id = i.id) as items_json
+                FROM invoices i
+                LEFT JOIN contacts c ON i.contact_id = c.id
+                WHERE i.id = ?
+            """, (invoice_id,))
+            rows = _rows_to_dicts(cursor)
+        
+        if not rows:
             return None
         
-        invoice = dict(invoice_row)
-        
-        # Get items
-        cursor.execute("""
-            SELECT ii.*, p.name as product_name
-            FROM invoice_items ii
-            LEFT JOIN products p ON ii.product_id = p.id
-            WHERE ii.invoice_id = ?
-        """, (invoice_id,))
-        
-        invoice["items"] = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
+        invoice = rows[0]
+        invoice["items"] = _loads(invoice.pop("items_json"))
         return invoice
     
+    def add_invoice_items_bulk(self, invoice_id: int, items: List[Dict]) -> List[int]:
+        """Add line items to an invoice in a single transaction."""
+        return self._insert_many(
+            INVOICE_ITEM_INSERT, [_invoice_item_row(invoice_id, item) for item in items]
+        )
+    
+    @staticmethod
+    def _list_invoices_query(status: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for list_invoices."""
+        if status:
+            return INVOICE_LIST_BY_STATUS, (status, limit)
+        return INVOICE_LIST, (limit,)
+    
     def list_invoices(self, status: str = None, limit: int = 50) -> List[Dict]:
         """List invoices."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        sql = """
-            SELECT i.*, c.name as contact_name
-            FROM invoices i
-            LEFT JOIN contacts c ON i.contact_id = c.id
-        """
-        params = []
-        
-        if status:
-            sql += " WHERE i.status = ?"
-            params.append(status)
-        
-        sql += " ORDER BY i.created_at DESC LIMIT ?"
-        params.append(limit)
-        
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        sql, params = self._list_invoices_query(status, limit)
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    def list_invoices_json(self, status: str = None, limit: int = 50) -> bytes:
+        """List invoices as a UTF-8 JSON array, serialized by SQLite."""
+        sql, params = self._list_invoices_query(status, limit)
+        return self._query_json(INVOICE_JSON_COLS, sql, params)
+    
+    def iter_invoices(self, status: str = None, limit: int = -1) -> Iterator[Dict]:
+        """Stream invoices one at a time (no limit by default), for large exports."""
+        sql, params = self._list_invoices_query(status, limit)
+        return self._iter_rows(sql, params)
     
     def get_invoice_summary(self) -> Dict:
         """Get invoice summary stats."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         summary = {}
         
-        # Totals by status
-        cursor.execute("""
-            SELECT status, COUNT(*) as count, SUM(total) as total
-            FROM invoices
-            GROUP BY status
-        """)
-        summary["by_status"] = {row["status"]: {"count": row["count"], "total": row["total"] or 0} 
-                               for row in cursor.fetchall()}
+        with self._conn() as conn:
+            cursor = conn.cursor()
+            
+            # Totals by status
+            cursor.execute("""
+                SELECT status, COUNT(*) as count, SUM(total) as total
+                FROM invoices
+                GROUP BY status
+            """)
+            summary["by_status"] = {row["status"]: {"count": row["count"], "total": row["total"] or 0} 
+                                   for row in cursor.fetchall()}
+            
+            # Overall totals, paid vs unpaid - one pass over invoices
+            cursor.execute("""
+                SELECT COUNT(*) as count,
+                       COALESCE(SUM(total), 0) as total,
+                       COALESCE(SUM(CASE WHEN status = 'paid' THEN total END), 0) as paid,
+                       COALESCE(SUM(CASE WHEN status IN ('sent', 'overdue') THEN total END), 0)
+                           as outstanding
+                FROM invoices
+            """)
+            row = cursor.fetchone()
+            summary["total_invoices"] = row["count"]
+            summary["total_amount"] = row["total"]
+            summary["total_paid"] = row["paid"]
+            summary["total_outstanding"] = row["outstanding"]
         
-        # Overall totals
-        cursor.execute("SELECT COUNT(*) as count, SUM(total) as total FROM invoices")
-        row = cursor.fetchone()
-        summary["total_invoices"] = row["count"]
-        summary["total_amount"] = row["total"] or 0
-        
-        # Paid vs unpaid
-        cursor.execute("SELECT SUM(total) FROM invoices WHERE status = 'paid'")
-        summary["total_paid"] = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT SUM(total) FROM invoices WHERE status IN ('sent', 'overdue')")
-        summary["total_outstanding"] = cursor.fetchone()[0] or 0
-        
-        conn.close()
         return summary
     
     # ═══════════════════════════════════════════════════════════════════════════
@@ -500,71 +1114,49 @@ class BusinessDatabase:
     
     def add_task(self, title: str, **kwargs) -> int:
         """Add a new task."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        fields = ["title"]
-        values = [title]
-        
-        for key in ["description", "project_id", "contact_id", "status", 
-                    "priority", "due_date"]:
-            if key in kwargs:
-                fields.append(key)
-                values.append(kwargs[key])
-        
-        if "tags" in kwargs:
-            fields.append("tags")
-            values.append(json.dumps(kwargs["tags"]))
-        
-        placeholders = ", ".join(["?" for _ in values])
-        field_names = ", ".join(fields)
-        
-        cursor.execute(f"INSERT INTO tasks ({field_names}) VALUES ({placeholders})", values)
-        task_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return task_id
+        with self._conn(write=True) as conn:
+            return conn.execute(TASK_INSERT, _task_row(title, kwargs)).fetchone()[0]
+    
+    def add_tasks_bulk(self, rows: List[Dict]) -> List[int]:
+        """Add many tasks in a single transaction. Each dict needs a "title"."""
+        return self._insert_many(
+            TASK_INSERT, [_task_row(row["title"], row) for row in rows]
+        )
+    
+    @staticmethod
+    def _list_tasks_query(status: str, priority: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for list_tasks."""
+        params = tuple(value for value in (status, priority) if value) + (limit,)
+        return TASK_LIST[bool(status), bool(priority)], params
     
     def list_tasks(self, status: str = None, priority: str = None, limit: int = 50) -> List[Dict]:
         """List tasks."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        sql = "SELECT * FROM tasks WHERE 1=1"
-        params = []
-        
-        if status:
-            sql += " AND status = ?"
-            params.append(status)
-        
-        if priority:
-            sql += " AND priority = ?"
-            params.append(priority)
-        
-        sql += " ORDER BY CASE priority WHEN 'urgent' THEN 1 WHEN 'high' THEN 2 WHEN 'medium' THEN 3 ELSE 4 END, due_date LIMIT ?"
-        params.append(limit)
-        
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        sql, params = self._list_tasks_query(status, priority, limit)
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    def list_tasks_json(self, status: str = None, priority: str = None, limit: int = 50) -> bytes:
+        """List tasks as a UTF-8 JSON array, serialized by SQLite."""
+        sql, params = self._list_tasks_query(status, priority, limit)
+        return self._query_json(TASK_JSON_COLS, sql, params)
+    
+    def iter_tasks(self, status: str = None, priority: str = None, limit: int = -1) -> Iterator[Dict]:
+        """Stream tasks one at a time (no limit by default), for large exports."""
+        sql, params = self._list_tasks_query(status, priority, limit)
+        return self._iter_rows(sql, params)
+    
+    def count_tasks_by_status_priority(self) -> Dict[Tuple[str, str], int]:
+        """Count tasks per (status, priority) pair."""
+        with self._conn() as conn:
+            rows = conn.execute(TASK_COUNT_BY_STATUS_PRIORITY).fetchall()
+        return {(status, priority): count for status, priority, count in rows}
     
     def complete_task(self, task_id: int) -> bool:
         """Mark a task as completed."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE tasks 
-            SET status = 'done', completed_at = ?, updated_at = ?
-            WHERE id = ?
-        """, (datetime.now().isoformat(), datetime.now().isoformat(), task_id))
-        
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
-        return success
+        with self._conn(write=True) as conn:
+            cursor = conn.execute(TASK_COMPLETE, (task_id,))
+            return cursor.rowcount > 0
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Notes Management
@@ -572,62 +1164,49 @@ class BusinessDatabase:
     
     def add_note(self, title: str, content: str = "", **kwargs) -> int:
         """Add a new note."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        fields = ["title", "content"]
-        values = [title, content]
-        
-        for key in ["category", "contact_id", "project_id"]:
-            if key in kwargs:
-                fields.append(key)
-                values.append(kwargs[key])
-        
-        if "tags" in kwargs:
-            fields.append("tags")
-            values.append(json.dumps(kwargs["tags"]))
-        
-        placeholders = ", ".join(["?" for _ in values])
-        field_names = ", ".join(fields)
-        
-        cursor.execute(f"INSERT INTO notes ({field_names}) VALUES ({placeholders})", values)
-        note_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return note_id
+        with self._conn(write=True) as conn:
+            return conn.execute(NOTE_INSERT, _note_row(title, content, kwargs)).fetchone()[0]
+    
+    def add_notes_bulk(self, rows: List[Dict]) -> List[int]:
+        """Add many notes in a single transaction. Each dict needs a "title"."""
+        return self._insert_many(
+            NOTE_INSERT,
+            [_note_row(row["title"], row.get("content", ""), row) for row in rows]
+        )
     
     def search_notes(self, query: str) -> List[Dict]:
         """Search notes by title or content."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT * FROM notes 
-            WHERE title LIKE ? OR content LIKE ?
-            ORDER BY updated_at DESC
-        """, (f"%{query}%", f"%{query}%"))
+        match = _fts_query(query)
+        if not match:
+            return []
         
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(NOTE_SEARCH, (match,)))
+        return rows
+    
+    @staticmethod
+    def _list_notes_query(category: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters for list_notes."""
+        if category:
+            return NOTE_LIST_BY_CATEGORY, (category, limit)
+        return NOTE_LIST, (limit,)
     
     def list_notes(self, category: str = None, limit: int = 50) -> List[Dict]:
         """List notes."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        if category:
-            cursor.execute(
-                "SELECT * FROM notes WHERE category = ? ORDER BY updated_at DESC LIMIT ?",
-                (category, limit)
-            )
-        else:
-            cursor.execute("SELECT * FROM notes ORDER BY updated_at DESC LIMIT ?", (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        return [dict(row) for row in rows]
+        sql, params = self._list_notes_query(category, limit)
+        with self._conn() as conn:
+            rows = _rows_to_dicts(conn.execute(sql, params))
+        return rows
+    
+    def list_notes_json(self, category: str = None, limit: int = 50) -> bytes:
+        """List notes as a UTF-8 JSON array, serialized by SQLite."""
+        sql, params = self._list_notes_query(category, limit)
+        return self._query_json(NOTE_JSON_COLS, sql, params)
+    
+    def iter_notes(self, category: str = None, limit: int = -1) -> Iterator[Dict]:
+        """Stream notes one at a time (no limit by default), for large exports."""
+        sql, params = self._list_notes_query(category, limit)
+        return self._iter_rows(sql, params)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # Settings
@@ -635,33 +1214,21 @@ class BusinessDatabase:
     
     def set_setting(self, key: str, value: Any):
         """Set a business setting."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        value_str = json.dumps(value) if not isinstance(value, str) else value
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO business_settings (key, value, updated_at)
-            VALUES (?, ?, ?)
-        """, (key, value_str, datetime.now().isoformat()))
+        value_str = _dumps(value) if not isinstance(value, str) else value
         
-        conn.commit()
-        conn.close()
+        with self._conn(write=True) as conn:
+            conn.execute(SETTING_SET, (key, value_str))
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a business setting."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT value FROM business_settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._conn() as conn:
+            row = conn.execute(SETTING_GET, (key,)).fetchone()
         
         if not row:
             return default
         
         try:
-            return json.loads(row["value"])
+            return _loads(row["value"])
         except (json.JSONDecodeError, TypeError):
             return row["value"]
     
@@ -671,59 +1238,67 @@ class BusinessDatabase:
     
     def get_dashboard_stats(self) -> Dict:
         """Get overview statistics for dashboard."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        # Contacts
-        cursor.execute("SELECT COUNT(*) FROM contacts")
-        stats["total_contacts"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM contacts WHERE type = 'client'")
-        stats["total_clients"] = cursor.fetchone()[0]
-        
-        # Products
-        cursor.execute("SELECT COUNT(*) FROM products WHERE active = 1")
-        stats["total_products"] = cursor.fetchone()[0]
-        
-        # Invoices
-        cursor.execute("SELECT SUM(total) FROM invoices WHERE status = 'paid'")
-        stats["revenue_paid"] = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT SUM(total) FROM invoices WHERE status IN ('sent', 'overdue')")
-        stats["revenue_outstanding"] = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT COUNT(*) FROM invoices WHERE status = 'overdue'")
-        stats["overdue_invoices"] = cursor.fetchone()[0]
-        
-        # Tasks
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE status = 'todo'")
-        stats["pending_tasks"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE status = 'in-progress'")
-        stats["active_tasks"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM tasks WHERE priority = 'urgent' AND status != 'done'")
-        stats["urgent_tasks"] = cursor.fetchone()[0]
-        
-        # Projects
-        cursor.execute("SELECT COUNT(*) FROM projects WHERE status = 'active'")
-        stats["active_projects"] = cursor.fetchone()[0]
-        
-        conn.close()
-        return stats
+        with self._conn() as conn:
+            row = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM contacts) AS total_contacts,
+                    (SELECT COUNT(*) FROM contacts c
+                     WHERE c.type_id = (SELECT id FROM contact_types WHERE name = 'client'))
+                        AS total_clients,
+                    (SELECT COUNT(*) FROM products WHERE active = 1) AS total_products,
+                    inv.revenue_paid,
+                    inv.revenue_outstanding,
+                    inv.overdue_invoices,
+                    task.pending_tasks,
+                    task.active_tasks,
+                    task.urgent_tasks,
+                    (SELECT COUNT(*) FROM projects WHERE status = 'active') AS active_projects
+                FROM
+                    (SELECT
+                        COALESCE(SUM(CASE WHEN status = 'paid' THEN total END), 0) AS revenue_paid,
+                        COALESCE(SUM(CASE WHEN status IN ('sent', 'overdue') THEN total END), 0)
+                            AS revenue_outstanding,
+                        COUNT(CASE WHEN status = 'overdue' THEN 1 END) AS overdue_invoices
+                     FROM invoices) AS inv,
+                    (SELECT
+                        COUNT(CASE WHEN status = 'todo' THEN 1 END) AS pending_tasks,
+                        COUNT(CASE WHEN status = 'in-progress' THEN 1 END) AS active_tasks,
+                        COUNT(CASE WHEN priority = 'urgent' AND status != 'done' THEN 1 END)
+                            AS urgent_tasks
+                     FROM tasks) AS task
+            """).fetchone()
+        
+        return {
+            "total_contacts": row[0],
+            "total_clients": row[1],
+            "total_products": row[2],
+            "revenue_paid": row[3],
+            "revenue_outstanding": row[4],
+            "overdue_invoices": row[5],
+            "pending_tasks": row[6],
+            "active_tasks": row[7],
+            "urgent_tasks": row[8],
+            "active_projects": row[9],
+        }
     
     def execute_query(self, sql: str, params: tuple = ()) -> List[Dict]:
-        """Execute a custom SQL query (SELECT only for safety)."""
-        if not sql.strip().upper().startswith("SELECT"):
-            raise ValueError("Only SELECT queries are allowed")
-        
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """Execute a custom read-only SQL query (SELECT or WITH ... SELECT).
         
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
+        Enforced by the read-only authorizer when SQLite prepares the
+        statement, so comments or stacked statements can't slip a write in.
+        """
+        with self._conn() as conn:
+            if self._in_memory:
+                # Everything shares the writer here; guard just this query
+                conn.set_authorizer(_read_only_authorizer)
+            try:
+                rows = _rows_to_dicts(conn.execute(sql, params))
+            except sqlite3.DatabaseError as e:
+                if getattr(e, "sqlite_errorcode", None) == sqlite3.SQLITE_AUTH:
+                    raise ValueError("Only read-only queries are allowed") from e
+                raise
+            finally:
+                if self._in_memory:
+                    conn.set_authorizer(None)
+        
+        return rows
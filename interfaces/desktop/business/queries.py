@@ -4,11 +4,137 @@ Detects and handles business-related queries using local database
 and web search integration.
 """
 
+import copy
 import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple, Any
 from .database import BusinessDatabase
 
 
+# Patterns used on every call are compiled once here
+_EMAIL_RE = re.compile(r'[\w.\-]+@[\w.\-]+\.\w+')
+_PHONE_RE = re.compile(r'[\d\-()\s]{10,}')
+# Runs of whitespace-separated words starting with a letter, none containing "@".
+# re has no Unicode uppercase class, so _extract_name() checks isupper() itself.
+_NAME_RUN_RE = re.compile(r'(?<!\S)[^\W\d_][^\s@]*(?:\s+[^\W\d_][^\s@]*)*(?!\S)')
+
+# Common query words dropped when extracting a search term
+_STOP_WORDS = frozenset({
+    "find", "search", "show", "list", "get", "display", "look", "for", "up",
+    "all", "my", "the", "a", "an", "me", "contacts", "clients", "products",
+    "invoices", "tasks", "notes", "please", "can", "you", "i", "want", "to", "see",
+})
+
+# Status/priority filters named in a message, in order of precedence
+_WORD_RE = re.compile(r"[\w-]+")
+_INVOICE_STATUS_BY_WORD = {"overdue": "overdue", "paid": "paid", "unpaid": "sent", "outstanding": "sent"}
+_TASK_STATUS_BY_WORD = {
+    "pending": "todo", "todo": "todo",
+    "in progress": "in-progress", "active": "in-progress",
+    "done": "done", "completed": "done",
+}
+_TASK_PRIORITY_BY_WORD = {"urgent": "urgent"}
+# Invoice queries about money owed/earned get the summary rather than a list
+_INVOICE_SUMMARY_RE = re.compile(r'total|revenue|outstanding|overdue')
+
+
+def _message_tokens(message_lower: str) -> set:
+    """Words in a message, plus adjacent word pairs for two-word filters."""
+    words = _WORD_RE.findall(message_lower)
+    return set(words).union(map(" ".join, zip(words, words[1:])))
+
+
+def _extract_name(text: str) -> Optional[str]:
+    """First run of words starting with a capital letter, or None."""
+    for run in _NAME_RUN_RE.finditer(text):
+        name_words = []
+        for word in run.group().split():
+            if word[0].isupper():
+                name_words.append(word)
+            elif name_words:
+                break
+        if name_words:
+            return ' '.join(name_words)
+    return None
+
+
+def _first_match(by_word: Dict[str, str], tokens: set) -> Optional[str]:
+    """Value for the highest-precedence key of by_word found in tokens."""
+    return next((value for word, value in by_word.items() if word in tokens), None)
+
+
+# One display line per record in the _handle_* listings. Rows come from
+# BusinessDatabase with every column present, so fields are pulled out in
+# one C-level itemgetter call rather than a .get() each.
+_contact_fields = itemgetter('name', 'company', 'email')
+_product_fields = itemgetter('name', 'price')
+_invoice_fields = itemgetter('invoice_number', 'contact_name', 'status', 'total')
+_task_fields = itemgetter('title', 'priority', 'status', 'due_date')
+_note_fields = itemgetter('title', 'content')
+
+_INVOICE_STATUS_ICON = {"paid": "✅", "overdue": "⚠️", "sent": "📤", "draft": "📝"}
+_TASK_PRIORITY_ICON = {"urgent": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+_TASK_STATUS_ICON = {"done": "✅", "in-progress": "🔄", "todo": "⬜"}
+
+
+def _contact_line(c: Dict, with_email: bool = False) -> str:
+    """Contact with company and, optionally, email."""
+    name, company, email = _contact_fields(c)
+    company = f" ({company})" if company else ""
+    email = f" - {email}" if with_email and email else ""
+    return f"• {name}{company}{email}"
+
+
+def _product_line(p: Dict) -> str:
+    """Product with its price, if set."""
+    name, price = _product_fields(p)
+    price = f" - ${price:,.2f}" if price else ""
+    return f"• {name}{price}"
+
+
+def _invoice_line(inv: Dict) -> str:
+    """Invoice number, client and total behind a status icon."""
+    number, client, status, total = _invoice_fields(inv)
+    status_icon = _INVOICE_STATUS_ICON.get(status, "📄")
+    return f"{status_icon} {number} - {client} - ${total:,.2f}"
+
+
+def _task_line(t: Dict) -> str:
+    """Task title and due date behind status and priority icons."""
+    title, priority, status, due = _task_fields(t)
+    priority_icon = _TASK_PRIORITY_ICON.get(priority, "⚪")
+    status_icon = _TASK_STATUS_ICON.get(status, "⬜")
+    due = f" (due: {due})" if due else ""
+    return f"{status_icon} {priority_icon} {title}{due}"
+
+
+def _note_line(n: Dict) -> str:
+    """Note title with the start of its content."""
+    title, content = _note_fields(n)
+    content = content or ''
+    preview = content[:50] + '...' if len(content) > 50 else content
+    return f"• {title}: {preview}"
+
+
+# Phrases suggesting external research (matched as substrings)
+_RESEARCH_KEYWORDS = (
+    "how to", "what is", "best practice", "industry", "market", "trend",
+    "competitor", "regulation", "law", "tax", "advice", "strategy",
+    "template", "example", "benchmark", "average", "standard",
+)
+_RESEARCH_RE = re.compile("|".join(map(re.escape, _RESEARCH_KEYWORDS)))
+
+
+class _QueryFailed(Exception):
+    """Raised inside the query cache so failed results are not stored."""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result["message"])
+        self.result = result
+
+
 class BusinessQueryHandler:
     """Handles business-related queries for Gene."""
     
@@ -52,47 +178,77 @@ class BusinessQueryHandler:
             "summary": ["summary", "stats", "statistics", "overview", "dashboard", "report",
                        "how many", "how much", "total", "count"]
         }
+        
+        self._build_keyword_scanner()
+        
+        # Repeated queries ("show tasks", "dashboard") are answered from here
+        # until the next write to the database changes db.version
+        self._cached_query = lru_cache(maxsize=128)(self._process_query_impl)
     
-    def is_business_query(self, message: str) -> bool:
-        """Check if a message is business-related."""
-        message_lower = message.lower()
+    def _build_keyword_scanner(self):
+        """Compile every keyword into one pattern that scans a message once.
         
-        # Check for business keywords
-        for category, keywords in self.business_keywords.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    return True
+        The lookahead reports a hit at every position, overlapping or not.
+        Alternatives are tried longest first, so the keyword found at a
+        position also stands for any shorter keyword that is its prefix.
         
-        return False
+        Each keyword then maps straight to the category and action it
+        implies, as an index into self._categories / self._actions where a
+        lower index wins, like the order of the keyword dicts.
+        """
+        self._categories = [cat for cat in self.business_keywords if cat != "general"]
+        self._actions = list(self.action_keywords)
+        
+        category_rank: Dict[str, int] = {}
+        for rank, category in enumerate(self._categories):
+            for keyword in self.business_keywords[category]:
+                category_rank.setdefault(keyword, rank)
+        action_rank: Dict[str, int] = {}
+        for rank, action in enumerate(self._actions):
+            for keyword in self.action_keywords[action]:
+                action_rank.setdefault(keyword, rank)
+        business = {keyword for keywords in self.business_keywords.values() for keyword in keywords}
+        
+        keywords = sorted(business | action_rank.keys(), key=len, reverse=True)
+        self._category_by_keyword: Dict[str, int] = {}
+        self._action_by_keyword: Dict[str, int] = {}
+        for keyword in keywords:
+            prefixes = [k for k in keywords if keyword.startswith(k)]
+            ranks = [category_rank[k] for k in prefixes if k in category_rank]
+            if ranks:
+                self._category_by_keyword[keyword] = min(ranks)
+            ranks = [action_rank[k] for k in prefixes if k in action_rank]
+            if ranks:
+                self._action_by_keyword[keyword] = min(ranks)
+        self._keyword_re = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        
+        # Any business keyword at all, found by a single search in C
+        self._business_re = re.compile(
+            "|".join(map(re.escape, sorted(business, key=len, reverse=True)))
+        )
     
-    def detect_query_type(self, message: str) -> Tuple[Optional[str], Optional[str]]:
+    def is_business_query(self, message: str) -> bool:
+        """Check if a message is business-related."""
+        return self._business_re.search(message.lower()) is not None
+    
+    def detect_query_type(
+        self, message: str, message_lower: str = None
+    ) -> Tuple[Optional[str], Optional[str]]:
         """Detect the category and action type of a business query.
         
+        Pass message_lower if the caller already has it, to skip lowercasing again.
+        
         Returns: (category, action) - e.g., ("contacts", "find")
         """
-        message_lower = message.lower()
-        
-        # Detect category
-        category = None
-        for cat, keywords in self.business_keywords.items():
-            if cat == "general":
-                continue
-            for keyword in keywords:
-                if keyword in message_lower:
-                    category = cat
-                    break
-            if category:
-                break
+        if message_lower is None:
+            message_lower = message.lower()
+        found = {match.group(1) for match in self._keyword_re.finditer(message_lower)}
         
-        # Detect action
-        action = None
-        for act, keywords in self.action_keywords.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    action = act
-                    break
-            if action:
-                break
+        # Earlier categories/actions win when several match
+        category_ranks = [self._category_by_keyword[k] for k in found if k in self._category_by_keyword]
+        action_ranks = [self._action_by_keyword[k] for k in found if k in self._action_by_keyword]
+        category = self._categories[min(category_ranks)] if category_ranks else None
+        action = self._actions[min(action_ranks)] if action_ranks else None
         
         # Default to find/summary if category detected but no action
         if category and not action:
@@ -111,7 +267,25 @@ class BusinessQueryHandler:
         - message: human-readable response
         - needs_web_search: bool (if local data insufficient)
         """
-        category, action = self.detect_query_type(message)
+        # Normalize so trivially different phrasings share a cache entry
+        message_lower = " ".join(message.lower().split())
+        try:
+            result = self._cached_query(message_lower, self.db.version)
+        except _QueryFailed as e:
+            return e.result
+        if result is None:
+            return None
+        # Callers get their own data to modify, not the cached one
+        return {**result, "data": copy.deepcopy(result["data"])}
+    
+    def _process_query_impl(self, message_lower: str, db_version: int) -> Optional[Dict[str, Any]]:
+        """Uncached process_query; db_version is only part of the cache key.
+        
+        A failed result is raised as _QueryFailed, which lru_cache doesn't
+        store, so a transient error isn't served again.
+        """
+        message = message_lower
+        category, action = self.detect_query_type(message, message_lower)
         
         if not category and not action:
             return None
@@ -128,24 +302,24 @@ class BusinessQueryHandler:
         
         try:
             # Handle different categories and actions
-            if action == "summary" or "dashboard" in message.lower() or "overview" in message.lower():
+            if action == "summary" or "dashboard" in message_lower or "overview" in message_lower:
                 result["data"] = self._get_summary(category)
                 result["message"] = self._format_summary(result["data"], category)
             
             elif category == "contacts":
-                result["data"], result["message"] = self._handle_contacts(message, action)
+                result["data"], result["message"] = self._handle_contacts(message, action, message_lower)
             
             elif category == "products":
-                result["data"], result["message"] = self._handle_products(message, action)
+                result["data"], result["message"] = self._handle_products(message, action, message_lower)
             
             elif category == "invoices":
-                result["data"], result["message"] = self._handle_invoices(message, action)
+                result["data"], result["message"] = self._handle_invoices(message, action, message_lower)
             
             elif category == "tasks":
-                result["data"], result["message"] = self._handle_tasks(message, action)
+                result["data"], result["message"] = self._handle_tasks(message, action, message_lower)
             
             elif category == "notes":
-                result["data"], result["message"] = self._handle_notes(message, action)
+                result["data"], result["message"] = self._handle_notes(message, action, message_lower)
             
             else:
                 # General business query - get dashboard
@@ -154,46 +328,44 @@ class BusinessQueryHandler:
             
             # Check if data is empty and web search might help
             if not result["data"] or (isinstance(result["data"], list) and len(result["data"]) == 0):
-                result["needs_web_search"] = self._should_suggest_web_search(message)
+                result["needs_web_search"] = self._should_suggest_web_search(message, message_lower)
                 if result["needs_web_search"]:
-                    result["search_suggestion"] = self._get_search_suggestion(message, category)
+                    result["search_suggestion"] = self._get_search_suggestion(message, category, message_lower)
         
         except Exception as e:
             result["success"] = False
             result["message"] = f"Error processing business query: {str(e)}"
+            raise _QueryFailed(result) from e
         
         return result
     
     def _get_summary(self, category: str = None) -> Dict:
         """Get summary statistics."""
         if category == "contacts":
-            contacts = self.db.list_contacts()
-            clients = [c for c in contacts if c.get("type") == "client"]
+            by_type = self.db.count_contacts_by_type()
             return {
-                "total_contacts": len(contacts),
-                "total_clients": len(clients),
-                "contacts": contacts[:5]  # Top 5
+                "total_contacts": sum(by_type.values()),
+                "total_clients": by_type.get("client", 0),
+                "contacts": self.db.list_contacts(limit=5)  # Top 5
             }
         
         elif category == "products":
-            products = self.db.list_products()
             return {
-                "total_products": len(products),
-                "products": products[:5]
+                "total_products": self.db.count_products(),
+                "products": self.db.list_products(limit=5)
             }
         
         elif category == "invoices":
             return self.db.get_invoice_summary()
         
         elif category == "tasks":
-            tasks = self.db.list_tasks()
-            todo = [t for t in tasks if t.get("status") == "todo"]
-            urgent = [t for t in tasks if t.get("priority") == "urgent" and t.get("status") != "done"]
+            counts = self.db.count_tasks_by_status_priority()
             return {
-                "total_tasks": len(tasks),
-                "pending": len(todo),
-                "urgent": len(urgent),
-                "tasks": tasks[:5]
+                "total_tasks": sum(counts.values()),
+                "pending": sum(n for (status, _), n in counts.items() if status == "todo"),
+                "urgent": sum(n for (status, priority), n in counts.items()
+                              if priority == "urgent" and status != "done"),
+                "tasks": self.db.list_tasks(limit=5)
             }
         
         else:
@@ -240,13 +412,12 @@ class BusinessQueryHandler:
         
         return "\n".join(lines)
     
-    def _format_dashboard(self, data: Dict) -> str:
-        """Format dashboard stats."""
-        return self._format_summary(data, None)
-    
-    def _handle_contacts(self, message: str, action: str) -> Tuple[Any, str]:
+    def _handle_contacts(
+        self, message: str, action: str, message_lower: str = None
+    ) -> Tuple[Any, str]:
         """Handle contact-related queries."""
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
         
         if action == "add":
             # Extract name from message (simple extraction)
@@ -255,125 +426,98 @@ class BusinessQueryHandler:
         
         elif action in ["find", "summary"]:
             # Try to extract search term
-            search_term = self._extract_search_term(message)
+            search_term = self._extract_search_term(message, message_lower)
             
             if search_term:
                 contacts = self.db.search_contacts(search_term)
                 if contacts:
-                    lines = [f"Found {len(contacts)} contact(s):"]
-                    for c in contacts[:10]:
-                        company = f" ({c['company']})" if c.get('company') else ""
-                        email = f" - {c['email']}" if c.get('email') else ""
-                        lines.append(f"• {c['name']}{company}{email}")
-                    return contacts, "\n".join(lines)
+                    body = "\n".join(_contact_line(c, with_email=True) for c in contacts[:10])
+                    return contacts, f"Found {len(contacts)} contact(s):\n{body}"
                 else:
                     return [], f"No contacts found matching '{search_term}'"
             else:
                 # List all contacts
                 contacts = self.db.list_contacts()
                 if contacts:
-                    lines = [f"📇 All contacts ({len(contacts)}):"]
-                    for c in contacts[:10]:
-                        company = f" ({c['company']})" if c.get('company') else ""
-                        lines.append(f"• {c['name']}{company}")
-                    if len(contacts) > 10:
-                        lines.append(f"... and {len(contacts) - 10} more")
-                    return contacts, "\n".join(lines)
+                    body = "\n".join(_contact_line(c) for c in contacts[:10])
+                    more = f"\n... and {len(contacts) - 10} more" if len(contacts) > 10 else ""
+                    return contacts, f"📇 All contacts ({len(contacts)}):\n{body}{more}"
                 else:
                     return [], "No contacts in database yet."
         
         return None, "I can help you find, add, or manage contacts."
     
-    def _handle_products(self, message: str, action: str) -> Tuple[Any, str]:
+    def _handle_products(
+        self, message: str, action: str, message_lower: str = None
+    ) -> Tuple[Any, str]:
         """Handle product-related queries."""
         if action in ["find", "summary"]:
-            search_term = self._extract_search_term(message)
+            search_term = self._extract_search_term(message, message_lower)
             
             if search_term:
                 products = self.db.search_products(search_term)
                 if products:
-                    lines = [f"Found {len(products)} product(s):"]
-                    for p in products[:10]:
-                        price = f" - ${p['price']:,.2f}" if p.get('price') else ""
-                        lines.append(f"• {p['name']}{price}")
-                    return products, "\n".join(lines)
+                    body = "\n".join(_product_line(p) for p in products[:10])
+                    return products, f"Found {len(products)} product(s):\n{body}"
                 else:
                     return [], f"No products found matching '{search_term}'"
             else:
                 products = self.db.list_products()
                 if products:
-                    lines = [f"📦 All products ({len(products)}):"]
-                    for p in products[:10]:
-                        price = f" - ${p['price']:,.2f}" if p.get('price') else ""
-                        lines.append(f"• {p['name']}{price}")
-                    return products, "\n".join(lines)
+                    body = "\n".join(_product_line(p) for p in products[:10])
+                    return products, f"📦 All products ({len(products)}):\n{body}"
                 else:
                     return [], "No products in database yet."
         
         return None, "I can help you find or manage products and services."
     
-    def _handle_invoices(self, message: str, action: str) -> Tuple[Any, str]:
+    def _handle_invoices(
+        self, message: str, action: str, message_lower: str = None
+    ) -> Tuple[Any, str]:
         """Handle invoice-related queries."""
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
         
-        if action == "summary" or any(word in message_lower for word in ["total", "revenue", "outstanding", "overdue"]):
+        if action == "summary" or _INVOICE_SUMMARY_RE.search(message_lower):
             summary = self.db.get_invoice_summary()
             return summary, self._format_summary(summary, "invoices")
         
         # Filter by status
-        status = None
-        if "overdue" in message_lower:
-            status = "overdue"
-        elif "paid" in message_lower:
-            status = "paid"
-        elif "unpaid" in message_lower or "outstanding" in message_lower:
-            status = "sent"
+        status = _first_match(_INVOICE_STATUS_BY_WORD, _message_tokens(message_lower))
         
         invoices = self.db.list_invoices(status=status)
         
         if invoices:
-            lines = [f"💰 Invoices ({len(invoices)}):"]
-            for inv in invoices[:10]:
-                client = inv.get('contact_name', 'Unknown')
-                status_icon = {"paid": "✅", "overdue": "⚠️", "sent": "📤", "draft": "📝"}.get(inv.get('status'), "📄")
-                lines.append(f"{status_icon} {inv['invoice_number']} - {client} - ${inv['total']:,.2f}")
-            return invoices, "\n".join(lines)
+            body = "\n".join(_invoice_line(inv) for inv in invoices[:10])
+            return invoices, f"💰 Invoices ({len(invoices)}):\n{body}"
         else:
             return [], "No invoices found."
     
-    def _handle_tasks(self, message: str, action: str) -> Tuple[Any, str]:
+    def _handle_tasks(
+        self, message: str, action: str, message_lower: str = None
+    ) -> Tuple[Any, str]:
         """Handle task-related queries."""
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
         
         # Filter by status/priority
-        status = None
-        priority = None
-        
-        if "urgent" in message_lower:
-            priority = "urgent"
-        if "pending" in message_lower or "todo" in message_lower:
-            status = "todo"
-        elif "in progress" in message_lower or "active" in message_lower:
-            status = "in-progress"
-        elif "done" in message_lower or "completed" in message_lower:
-            status = "done"
+        tokens = _message_tokens(message_lower)
+        status = _first_match(_TASK_STATUS_BY_WORD, tokens)
+        priority = _first_match(_TASK_PRIORITY_BY_WORD, tokens)
         
         tasks = self.db.list_tasks(status=status, priority=priority)
         
         if tasks:
-            lines = [f"✅ Tasks ({len(tasks)}):"]
-            for t in tasks[:10]:
-                priority_icon = {"urgent": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(t.get('priority'), "⚪")
-                status_icon = {"done": "✅", "in-progress": "🔄", "todo": "⬜"}.get(t.get('status'), "⬜")
-                due = f" (due: {t['due_date']})" if t.get('due_date') else ""
-                lines.append(f"{status_icon} {priority_icon} {t['title']}{due}")
-            return tasks, "\n".join(lines)
+            body = "\n".join(_task_line(t) for t in tasks[:10])
+            return tasks, f"✅ Tasks ({len(tasks)}):\n{body}"
         else:
             return [], "No tasks found."
     
-    def _handle_notes(self, message: str, action: str) -> Tuple[Any, str]:
+    def _handle_notes(
+        self, message: str, action: str, message_lower: str = None
+    ) -> Tuple[Any, str]:
         """Handle note-related queries."""
-        search_term = self._extract_search_term(message)
+        search_term = self._extract_search_term(message, message_lower)
         
         if search_term:
             notes = self.db.search_notes(search_term)
@@ -381,43 +525,32 @@ class BusinessQueryHandler:
             notes = self.db.list_notes()
         
         if notes:
-            lines = [f"📝 Notes ({len(notes)}):"]
-            for n in notes[:10]:
-                preview = (n.get('content', '')[:50] + '...') if len(n.get('content', '')) > 50 else n.get('content', '')
-                lines.append(f"• {n['title']}: {preview}")
-            return notes, "\n".join(lines)
+            body = "\n".join(_note_line(n) for n in notes[:10])
+            return notes, f"📝 Notes ({len(notes)}):\n{body}"
         else:
             return [], "No notes found."
     
-    def _extract_search_term(self, message: str) -> Optional[str]:
+    def _extract_search_term(self, message: str, message_lower: str = None) -> Optional[str]:
         """Extract search term from a message."""
-        # Remove common query words
-        stop_words = ["find", "search", "show", "list", "get", "display", "look", "for", "up",
-                     "all", "my", "the", "a", "an", "me", "contacts", "clients", "products",
-                     "invoices", "tasks", "notes", "please", "can", "you", "i", "want", "to", "see"]
+        if message_lower is None:
+            message_lower = message.lower()
         
-        words = message.lower().split()
-        filtered = [w for w in words if w not in stop_words and len(w) > 2]
+        # Remove common query words
+        words = message_lower.split()
+        filtered = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
         
         # Return remaining words as search term
         if filtered:
             return " ".join(filtered)
         return None
     
-    def _should_suggest_web_search(self, message: str) -> bool:
+    def _should_suggest_web_search(self, message: str, message_lower: str = None) -> bool:
         """Check if web search would be helpful."""
-        message_lower = message.lower()
-        
-        # Keywords suggesting external research
-        research_keywords = [
-            "how to", "what is", "best practice", "industry", "market", "trend",
-            "competitor", "regulation", "law", "tax", "advice", "strategy",
-            "template", "example", "benchmark", "average", "standard"
-        ]
-        
-        return any(keyword in message_lower for keyword in research_keywords)
+        if message_lower is None:
+            message_lower = message.lower()
+        return _RESEARCH_RE.search(message_lower) is not None
     
-    def _get_search_suggestion(self, message: str, category: str) -> str:
+    def _get_search_suggestion(self, message: str, category: str, message_lower: str = None) -> str:
         """Generate a web search suggestion."""
         # Create a search query based on the message and category
         base_terms = {
@@ -431,7 +564,7 @@ class BusinessQueryHandler:
         base = base_terms.get(category, "business management")
         
         # Extract key terms from message
-        search_term = self._extract_search_term(message)
+        search_term = self._extract_search_term(message, message_lower)
         if search_term:
             return f"{search_term} {base}"
         return base
@@ -446,26 +579,19 @@ class BusinessQueryHandler:
         data = {}
         
         # Extract email
-        email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+        email_match = _EMAIL_RE.search(text)
         if email_match:
             data['email'] = email_match.group()
         
         # Extract phone (simple pattern)
-        phone_match = re.search(r'[\d\-\(\)\s]{10,}', text)
+        phone_match = _PHONE_RE.search(text)
         if phone_match:
             data['phone'] = phone_match.group().strip()
         
         # The first capitalized words are likely the name
-        words = text.split()
-        name_words = []
-        for word in words:
-            if word[0].isupper() and '@' not in word and not word.isdigit():
-                name_words.append(word)
-            elif name_words:
-                break
-        
-        if name_words:
-            data['name'] = ' '.join(name_words)
+        name = _extract_name(text)
+        if name:
+            data['name'] = name
         
         if 'name' not in data:
             return False, "Could not extract a name. Please provide a name for the contact."
@@ -490,10 +616,8 @@ class BusinessQueryHandler:
         
         # Check for date keywords (simple)
         if 'tomorrow' in text_lower:
-            from datetime import datetime, timedelta
             data['due_date'] = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
         elif 'today' in text_lower:
-            from datetime import datetime
             data['due_date'] = datetime.now().strftime('%Y-%m-%d')
         
         try:
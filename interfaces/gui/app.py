@@ -10,6 +10,12 @@ A modern chat interface with:
 import gradio as gr
 import sys
 import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,6 +33,18 @@ DEFAULT_SYSTEM_PROMPT = """You are a helpful AI coding assistant running locally
 You help with programming questions, code review, debugging, and general software development.
 Be concise but thorough. Use code blocks with syntax highlighting when showing code."""
 
+# History sent with each message grows append-only (so the model's cached
+# context for earlier turns stays valid) until HISTORY_WINDOW messages, then
+# restarts from the last HISTORY_KEEP.
+HISTORY_WINDOW = 20
+HISTORY_KEEP = 10
+
+# Chat roles sent to Ollama for history entries; anything else is the assistant
+_HISTORY_ROLE = {"user": "user"}
+
+# Seconds that Ollama status and model list lookups are reused for
+STATUS_TTL = 30
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # Ollama Client
@@ -34,13 +52,17 @@ Be concise but thorough. Use code blocks with syntax highlighting when showing c
 
 client = OllamaClient()
 
-# Current settings (can be changed via UI)
-current_model = DEFAULT_MODEL
-current_system_prompt = DEFAULT_SYSTEM_PROMPT
+# Generation runs here so Gradio's handler threads stay free for UI events
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_STREAM_END = object()
 
+# Chunks buffered between a worker and its (possibly slow) consumer
+STREAM_BUFFER = 64
 
-def get_available_models():
-    """Get list of available Ollama models."""
+
+@lru_cache(maxsize=1)
+def _cached_models(ttl_bucket: int):
+    """Fetch the model list; cached per TTL bucket."""
     try:
         models = client.list_models()
         return models if models else [DEFAULT_MODEL]
@@ -48,75 +70,149 @@ def get_available_models():
         return [DEFAULT_MODEL]
 
 
-def check_ollama_status():
-    """Check if Ollama is running."""
+@lru_cache(maxsize=1)
+def _cached_status(ttl_bucket: int):
+    """Probe Ollama; cached per TTL bucket."""
     try:
         return client.health_check()
     except Exception:
         return False
 
 
+def get_available_models():
+    """Get list of available Ollama models."""
+    return _cached_models(int(time.time()) // STATUS_TTL)
+
+
+def check_ollama_status():
+    """Check if Ollama is running."""
+    return _cached_status(int(time.time()) // STATUS_TTL)
+
+
+def refresh_models():
+    """Drop cached Ollama lookups and repopulate the model dropdown."""
+    _cached_models.cache_clear()
+    _cached_status.cache_clear()
+    models = get_available_models() if check_ollama_status() else [DEFAULT_MODEL]
+    return gr.update(choices=models)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # Chat Function
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def respond(message: str, history: list):
+def _stream_chat(model: str, messages: list):
+    """Yield chat chunks produced by a worker thread, re-raising its errors.
+
+    Closing the generator (e.g. Gradio abandoning the stream) cancels the
+    worker, which closes the HTTP stream and frees its executor slot.
+    """
+    chunks = queue.Queue(maxsize=STREAM_BUFFER)
+    cancelled = threading.Event()
+
+    def put(item) -> bool:
+        while not cancelled.is_set():
+            try:
+                chunks.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        stream = client.chat_stream(model, messages)
+        try:
+            for chunk in stream:
+                if not put(chunk):
+                    break
+        except Exception as e:
+            put(e)
+        finally:
+            stream.close()
+            put(_STREAM_END)
+
+    EXECUTOR.submit(produce)
+    try:
+        while True:
+            try:
+                item = chunks.get(timeout=client.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No response from Ollama in {client.timeout}s") from None
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+
+
+def history_window(history: list, session: dict) -> list:
+    """Return the part of the history to send, advancing the session's window."""
+    start = session.get("window_start", 0)
+    if start > len(history):
+        # The chat was cleared
+        start = 0
+    if len(history) - start >= HISTORY_WINDOW:
+        start = len(history) - HISTORY_KEEP
+    session["window_start"] = start
+    return history[start:]
+
+
+def respond(message: str, history: list, session: dict):
     """
-    Process a chat message and return the response.
+    Process a chat message, streaming the response as it is generated.
     
     Args:
         message: User's input message
         history: List of {"role": "user/assistant", "content": "..."} dicts
+        session: Per-session state (gr.State): model, system prompt and
+            history window start
     
-    Returns:
-        Response text
+    Yields:
+        The response text so far (Gradio re-renders it on each yield)
     """
-    global current_model, current_system_prompt
-    
     if not message.strip():
-        return ""
-    
-    # Build the full prompt with context
-    parts = []
-    
-    # Add system prompt
-    if current_system_prompt:
-        parts.append(f"System: {current_system_prompt}\n")
+        yield ""
+        return
     
-    # Add conversation history (last 10 exchanges)
-    for msg in history[-20:]:
-        role = msg.get("role", "user")
-        content = msg.get("content", "")
-        if role == "user":
-            parts.append(f"User: {content}")
-        else:
-            parts.append(f"Assistant: {content}")
-    
-    # Add current message
-    parts.append(f"User: {message}")
-    parts.append("Assistant:")
-    
-    full_prompt = "\n\n".join(parts)
+    # System prompt, then conversation history, then the current message
+    system_prompt = session.get("prompt", DEFAULT_SYSTEM_PROMPT)
+    messages = (
+        [{"role": "system", "content": system_prompt}] if system_prompt else []
+    )
+    messages.extend(
+        {
+            "role": _HISTORY_ROLE.get(msg.get("role", "user"), "assistant"),
+            "content": msg.get("content", ""),
+        }
+        for msg in history_window(history, session)
+    )
+    messages.append({"role": "user", "content": message})
     
+    response = ""
     try:
-        response = client.generate(current_model, full_prompt)
-        return response
+        with closing(_stream_chat(session.get("model", DEFAULT_MODEL), messages)) as stream:
+            for chunk in stream:
+                response += chunk
+                yield response
     except Exception as e:
-        return f"❌ Error: {str(e)}\n\nMake sure Ollama is running: `ollama serve`"
+        if check_ollama_status():
+            yield f"❌ Error: {str(e)}"
+        else:
+            yield f"❌ Error: {str(e)}\n\nMake sure Ollama is running: `ollama serve`"
 
 
-def update_model(model: str):
-    """Update the current model."""
-    global current_model
-    current_model = model
-    return f"✅ Model set to: {model}"
+def update_model(model: str, session: dict):
+    """Update the session's model."""
+    session["model"] = model
+    return f"✅ Model set to: {model}", session
 
 
-def update_system_prompt(prompt: str):
-    """Update the system prompt."""
-    global current_system_prompt
-    current_system_prompt = prompt
-    return "✅ System prompt updated"
+def update_system_prompt(prompt: str, session: dict):
+    """Update the session's system prompt."""
+    session["prompt"] = prompt
+    return "✅ System prompt updated", session
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -146,6 +242,11 @@ def create_ui():
         else:
             gr.Markdown("❌ **Ollama Not Running** | Start with: `ollama serve`")
         
+        # Per-session settings and history window
+        session = gr.State(
+            {"model": DEFAULT_MODEL, "prompt": DEFAULT_SYSTEM_PROMPT, "window_start": 0}
+        )
+        
         # Settings accordion
         with gr.Accordion("⚙️ Settings", open=False):
             with gr.Row():
@@ -161,6 +262,7 @@ def create_ui():
                     interactive=False,
                     scale=3,
                 )
+                refresh_btn = gr.Button("🔄 Refresh", size="sm", scale=1)
             
             system_prompt_box = gr.Textbox(
                 value=DEFAULT_SYSTEM_PROMPT,
@@ -178,12 +280,22 @@ def create_ui():
                 )
             
             # Wire settings events
-            model_dropdown.change(update_model, inputs=model_dropdown, outputs=model_status)
-            save_prompt_btn.click(update_system_prompt, inputs=system_prompt_box, outputs=prompt_status)
+            model_dropdown.change(
+                update_model,
+                inputs=[model_dropdown, session],
+                outputs=[model_status, session],
+            )
+            refresh_btn.click(refresh_models, outputs=model_dropdown)
+            save_prompt_btn.click(
+                update_system_prompt,
+                inputs=[system_prompt_box, session],
+                outputs=[prompt_status, session],
+            )
         
         # Main chat interface
         gr.ChatInterface(
             fn=respond,
+            additional_inputs=[session],
             examples=[
                 "Write a Python function to reverse a string",
                 "Explain async/await in Python",
@@ -1,6 +1,7 @@
 """Setup script for installing Ollama models."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from core.llm.ollama import OllamaClient
@@ -14,6 +15,9 @@ RECOMMENDED_MODELS = [
     "nomic-embed-text",
 ]
 
+# Concurrent pulls; downloads are network/disk bound, not CPU bound
+MAX_PARALLEL_PULLS = 3
+
 
 def main():
     """Download recommended models."""
@@ -25,13 +29,18 @@ def main():
 
     logger.info("Pulling recommended models...")
 
-    for model in RECOMMENDED_MODELS:
-        logger.info(f"Pulling {model}...")
-        success = client.pull_model(model)
-        if success:
-            logger.info(f"✅ {model}")
-        else:
-            logger.error(f"❌ {model}")
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_PULLS) as executor:
+        futures = {}
+        for model in RECOMMENDED_MODELS:
+            logger.info(f"Pulling {model}...")
+            futures[executor.submit(client.pull_model, model)] = model
+
+        for future in as_completed(futures):
+            model = futures[future]
+            if future.result():
+                logger.info(f"✅ {model}")
+            else:
+                logger.error(f"❌ {model}")
 
     logger.info("Done!")
     return 0
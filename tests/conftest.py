@@ -1,11 +1,23 @@
 """Test fixtures and utilities."""
 
+import asyncio
+
 import pytest
 from core.config.settings import Settings, set_settings
 from pathlib import Path
 import tempfile
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it's installed (not available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def temp_dir():
     """Create temporary directory for tests."""
@@ -19,3 +31,11 @@ def test_settings(temp_dir):
     settings = Settings(vector_db_path=temp_dir / "chroma_data")
     set_settings(settings)
     yield settings
+
+
+@pytest.fixture(scope="session")
+def python_version_result():
+    """Result of running `python --version` through TerminalServer, once per session."""
+    from domains.base.terminal.server import TerminalServer
+
+    return TerminalServer(enable_dangerous=False).run_command("python --version")
@@ -1,9 +1,11 @@
 """Integration test example."""
 
+import os
+import tempfile
+
 import pytest
 from domains.base.filesystem.server import FilesystemServer
 from domains.base.terminal.server import TerminalServer
-from core.llm.ollama import OllamaClient
 
 
 class TestIntegration:
@@ -14,24 +16,30 @@ class TestIntegration:
         """Filesystem server."""
         return FilesystemServer(root_path=str(temp_dir))
 
+    @pytest.fixture
+    def mem_fs_server(self):
+        """Filesystem server rooted in RAM-backed /dev/shm when available."""
+        shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        with tempfile.TemporaryDirectory(dir=shm) as tmpdir:
+            yield FilesystemServer(root_path=tmpdir)
+
     @pytest.fixture
     def term_server(self):
         """Terminal server."""
         return TerminalServer()
 
-    def test_read_and_analyze_code(self, fs_server):
+    def test_read_and_analyze_code(self, mem_fs_server):
         """Test reading code file (workflow step 1)."""
         code = '''def hello(name):
     return f"Hello, {name}!"
 '''
-        fs_server.write_file("test.py", code)
-        content = fs_server.read_file("test.py")
+        mem_fs_server.write_file("test.py", code)
+        content = mem_fs_server.read_file("test.py")
         assert "hello" in content
 
-    def test_run_test_command(self, term_server):
+    def test_run_test_command(self, python_version_result):
         """Test running pytest (workflow step 2)."""
-        result = term_server.run_command("python --version")
-        assert result["success"] is True
+        assert python_version_result["success"] is True
 
     def test_workflow_read_test_commit(self, fs_server, term_server):
         """Test complete workflow: Read -> Test -> Commit."""
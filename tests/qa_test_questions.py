@@ -8,226 +8,296 @@ Usage:
     python tests/qa_test_questions.py --auto  # Runs automated tests (requires app API)
 """
 
+import sys
 from datetime import datetime
+from types import MappingProxyType
+
+# Categories, index-aligned: name, description, whether internet is needed
+_CATEGORIES = (
+    "weather_location",
+    "weather_followup",
+    "current_events",
+    "prices_stocks",
+    "local_search",
+    "general_knowledge",
+    "coding_help",
+    "retry_and_correction",
+    "conversation_context",
+)
+
+_DESCRIPTIONS = (
+    "Weather queries with location - should search and extract temps",
+    "Weather with follow-up context - should combine context",
+    "News and current events - should search for recent info",
+    "Financial data - should search and extract prices",
+    "Location-based searches - should use detected/provided location",
+    "General knowledge - should answer without search",
+    "Programming questions - should answer from knowledge",
+    "Error recovery - should handle retry requests gracefully",
+    "Multi-turn conversations - should maintain context",
+)
+
+_REQUIRES_INTERNET = (True, True, True, True, True, False, False, True, False)
+
+# Questions: (category index, question, follow-up or None, expected behavior)
+_QUESTIONS = (
+    # weather_location
+    (
+        0,
+        "What is the temperature in Calgary right now?",
+        None,
+        "Should search, fetch weather data, return actual temperature in °C",
+    ),
+    (
+        0,
+        "What's the weather forecast for New York this week?",
+        None,
+        "Should search and provide multi-day forecast",
+    ),
+    (
+        0,
+        "Is it going to rain in Seattle tomorrow?",
+        None,
+        "Should search and provide precipitation info",
+    ),
+
+    # weather_followup
+    (
+        1,
+        "What's the temperature in my area?",
+        "Calgary AB",
+        "After providing location, should search 'temperature Calgary AB'",
+    ),
+    (
+        1,
+        "What's the weather like?",
+        "Toronto",
+        "Should combine 'weather Toronto' and search",
+    ),
+
+    # current_events
+    (
+        2,
+        "What's happening in the news today?",
+        None,
+        "Should search and summarize current headlines",
+    ),
+    (
+        2,
+        "What are the latest tech news?",
+        None,
+        "Should search for recent tech news",
+    ),
+    (
+        2,
+        "Who won the most recent Super Bowl?",
+        None,
+        "Should search and provide winner + score",
+    ),
+
+    # prices_stocks
+    (
+        3,
+        "What is the current price of Bitcoin?",
+        None,
+        "Should search and return current BTC price",
+    ),
+    (
+        3,
+        "What's the stock price of Apple?",
+        None,
+        "Should search and return AAPL stock price",
+    ),
+    (
+        3,
+        "How much does gold cost per ounce right now?",
+        None,
+        "Should search and return gold price",
+    ),
+
+    # local_search
+    (
+        4,
+        "What restaurants are near me?",
+        None,
+        "Should ask for location if not detected, then search",
+    ),
+    (
+        4,
+        "Where is the nearest coffee shop?",
+        None,
+        "Should search with location context",
+    ),
+    (
+        4,
+        "What time does the Calgary library open?",
+        None,
+        "Should search for specific local business hours",
+    ),
+
+    # general_knowledge
+    (
+        5,
+        "What is the capital of France?",
+        None,
+        "Should answer 'Paris' without searching",
+    ),
+    (
+        5,
+        "Explain how photosynthesis works",
+        None,
+        "Should provide educational explanation without search",
+    ),
+    (
+        5,
+        "Write a haiku about programming",
+        None,
+        "Should generate creative content without search",
+    ),
+
+    # coding_help
+    (
+        6,
+        "How do I read a file in Python?",
+        None,
+        "Should provide Python code example",
+    ),
+    (
+        6,
+        "What's the difference between let and const in JavaScript?",
+        None,
+        "Should explain JS variable declarations",
+    ),
+    (
+        6,
+        "Write a function to reverse a string",
+        None,
+        "Should provide working code",
+    ),
+
+    # retry_and_correction
+    (
+        7,
+        "What's the temperature?",
+        "You can't get that information?",
+        "Should retry with context if internet enabled",
+    ),
+    (
+        7,
+        "Search for Calgary weather",
+        None,
+        "Should perform direct search",
+    ),
+
+    # conversation_context
+    (
+        8,
+        "My name is Alex",
+        "What's my name?",
+        "Should remember and respond 'Alex'",
+    ),
+    (
+        8,
+        "Let's talk about Python programming",
+        "What are its main advantages?",
+        "Should understand 'its' refers to Python",
+    ),
+)
+
+
+def _build_test_questions():
+    """Build the nested {category: {description, requires_internet, questions}} view.
+
+    The outer mapping is a read-only MappingProxyType; the suite data lives in
+    the module-level tuples above.
+    """
+    test_questions = {
+        category: {
+            "description": description,
+            "requires_internet": requires_internet,
+            "questions": [],
+        }
+        for category, description, requires_internet in zip(
+            _CATEGORIES, _DESCRIPTIONS, _REQUIRES_INTERNET
+        )
+    }
+    for cat, q, followup, expect in _QUESTIONS:
+        q_data = {"q": q, "followup": followup, "expect": expect}
+        if followup is None:
+            del q_data["followup"]
+        test_questions[_CATEGORIES[cat]]["questions"].append(q_data)
+    return MappingProxyType(test_questions)
+
+
+def __getattr__(name):
+    """Build TEST_QUESTIONS on first access, for callers of the old dict."""
+    if name == "TEST_QUESTIONS":
+        globals()["TEST_QUESTIONS"] = test_questions = _build_test_questions()
+        return test_questions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_SUITE_HEADER = """\
+{rule}
+GENE QA TEST SUITE
+Generated: {generated}
+{rule}
+
+Instructions:
+1. Launch Gene desktop app
+2. Enable internet (🌐) for real-time queries
+3. Run through each question category
+4. Verify responses match expected behavior
+"""
+
+_CATEGORY_HEADER = """\
+{rule}
+CATEGORY: {category}
+Description: {description}
+Requires Internet: {internet}
+{rule}"""
 
-# Test categories with questions and expected behavior
-TEST_QUESTIONS = {
-    "weather_location": {
-        "description": "Weather queries with location - should search and extract temps",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What is the temperature in Calgary right now?",
-                "expect": "Should search, fetch weather data, return actual temperature in °C",
-            },
-            {
-                "q": "What's the weather forecast for New York this week?",
-                "expect": "Should search and provide multi-day forecast",
-            },
-            {
-                "q": "Is it going to rain in Seattle tomorrow?",
-                "expect": "Should search and provide precipitation info",
-            },
-        ],
-    },
-    
-    "weather_followup": {
-        "description": "Weather with follow-up context - should combine context",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What's the temperature in my area?",
-                "followup": "Calgary AB",
-                "expect": "After providing location, should search 'temperature Calgary AB'",
-            },
-            {
-                "q": "What's the weather like?",
-                "followup": "Toronto",
-                "expect": "Should combine 'weather Toronto' and search",
-            },
-        ],
-    },
-    
-    "current_events": {
-        "description": "News and current events - should search for recent info",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What's happening in the news today?",
-                "expect": "Should search and summarize current headlines",
-            },
-            {
-                "q": "What are the latest tech news?",
-                "expect": "Should search for recent tech news",
-            },
-            {
-                "q": "Who won the most recent Super Bowl?",
-                "expect": "Should search and provide winner + score",
-            },
-        ],
-    },
-    
-    "prices_stocks": {
-        "description": "Financial data - should search and extract prices",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What is the current price of Bitcoin?",
-                "expect": "Should search and return current BTC price",
-            },
-            {
-                "q": "What's the stock price of Apple?",
-                "expect": "Should search and return AAPL stock price",
-            },
-            {
-                "q": "How much does gold cost per ounce right now?",
-                "expect": "Should search and return gold price",
-            },
-        ],
-    },
-    
-    "local_search": {
-        "description": "Location-based searches - should use detected/provided location",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What restaurants are near me?",
-                "expect": "Should ask for location if not detected, then search",
-            },
-            {
-                "q": "Where is the nearest coffee shop?",
-                "expect": "Should search with location context",
-            },
-            {
-                "q": "What time does the Calgary library open?",
-                "expect": "Should search for specific local business hours",
-            },
-        ],
-    },
-    
-    "general_knowledge": {
-        "description": "General knowledge - should answer without search",
-        "requires_internet": False,
-        "questions": [
-            {
-                "q": "What is the capital of France?",
-                "expect": "Should answer 'Paris' without searching",
-            },
-            {
-                "q": "Explain how photosynthesis works",
-                "expect": "Should provide educational explanation without search",
-            },
-            {
-                "q": "Write a haiku about programming",
-                "expect": "Should generate creative content without search",
-            },
-        ],
-    },
-    
-    "coding_help": {
-        "description": "Programming questions - should answer from knowledge",
-        "requires_internet": False,
-        "questions": [
-            {
-                "q": "How do I read a file in Python?",
-                "expect": "Should provide Python code example",
-            },
-            {
-                "q": "What's the difference between let and const in JavaScript?",
-                "expect": "Should explain JS variable declarations",
-            },
-            {
-                "q": "Write a function to reverse a string",
-                "expect": "Should provide working code",
-            },
-        ],
-    },
-    
-    "retry_and_correction": {
-        "description": "Error recovery - should handle retry requests gracefully",
-        "requires_internet": True,
-        "questions": [
-            {
-                "q": "What's the temperature?",
-                "followup": "You can't get that information?",
-                "expect": "Should retry with context if internet enabled",
-            },
-            {
-                "q": "Search for Calgary weather",
-                "expect": "Should perform direct search",
-            },
-        ],
-    },
-    
-    "conversation_context": {
-        "description": "Multi-turn conversations - should maintain context",
-        "requires_internet": False,
-        "questions": [
-            {
-                "q": "My name is Alex",
-                "followup": "What's my name?",
-                "expect": "Should remember and respond 'Alex'",
-            },
-            {
-                "q": "Let's talk about Python programming",
-                "followup": "What are its main advantages?",
-                "expect": "Should understand 'its' refers to Python",
-            },
-        ],
-    },
-}
 
 def print_test_suite():
     """Print all test questions for manual testing."""
-    print("=" * 70)
-    print("GENE QA TEST SUITE")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
-    print()
-    print("Instructions:")
-    print("1. Launch Gene desktop app")
-    print("2. Enable internet (🌐) for real-time queries")
-    print("3. Run through each question category")
-    print("4. Verify responses match expected behavior")
-    print()
-    
-    total_questions = 0
+    rule = "=" * 70
+    out = [_SUITE_HEADER.format(rule=rule, generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))]
     
-    for category, data in TEST_QUESTIONS.items():
-        print("-" * 70)
-        print(f"CATEGORY: {category.upper()}")
-        print(f"Description: {data['description']}")
-        print(f"Requires Internet: {'Yes 🌐' if data['requires_internet'] else 'No'}")
-        print("-" * 70)
+    for cat, category in enumerate(_CATEGORIES):
+        out.append(_CATEGORY_HEADER.format(
+            rule="-" * 70,
+            category=category.upper(),
+            description=_DESCRIPTIONS[cat],
+            internet="Yes 🌐" if _REQUIRES_INTERNET[cat] else "No",
+        ))
         
-        for i, q_data in enumerate(data["questions"], 1):
-            total_questions += 1
-            print(f"\n  [{i}] Question: {q_data['q']}")
-            if "followup" in q_data:
-                print(f"      Follow-up: {q_data['followup']}")
-            print(f"      Expected: {q_data['expect']}")
+        questions = [question for question in _QUESTIONS if question[0] == cat]
+        for i, (_, q, followup, expect) in enumerate(questions, 1):
+            out.append(f"\n  [{i}] Question: {q}")
+            if followup is not None:
+                out.append(f"      Follow-up: {followup}")
+            out.append(f"      Expected: {expect}")
         
-        print()
+        out.append("")
     
-    print("=" * 70)
-    print(f"TOTAL: {total_questions} test questions across {len(TEST_QUESTIONS)} categories")
-    print("=" * 70)
+    out.append(rule)
+    out.append(f"TOTAL: {len(_QUESTIONS)} test questions across {len(_CATEGORIES)} categories")
+    out.append(rule)
+    sys.stdout.write("\n".join(out) + "\n")
 
 def get_test_questions_list():
     """Return flat list of all test questions."""
-    questions = []
-    for category, data in TEST_QUESTIONS.items():
-        for q_data in data["questions"]:
-            questions.append({
-                "category": category,
-                "requires_internet": data["requires_internet"],
-                **q_data
-            })
-    return questions
+    return [
+        {
+            "category": _CATEGORIES[cat],
+            "requires_internet": _REQUIRES_INTERNET[cat],
+            "q": q,
+            **({"followup": followup} if followup is not None else {}),
+            "expect": expect,
+        }
+        for cat, q, followup, expect in _QUESTIONS
+    ]
 
 if __name__ == "__main__":
-    import sys
-    
     if "--auto" in sys.argv:
         print("Automated testing not yet implemented.")
         print("Run without --auto for manual test questions.")
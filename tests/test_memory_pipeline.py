@@ -1,8 +1,7 @@
 """Integration tests for memory pipeline (Phase 2)."""
 
-import json
-import tempfile
-from pathlib import Path
+import time
+from collections import Counter
 
 import pytest
 
@@ -13,36 +12,91 @@ from core.memory.silos import CrossDomainQuery, DomainMemory
 from core.memory.vector_store import VectorStore
 
 
+class FakeVectorStore:
+    """In-memory VectorStore stand-in for tests that don't exercise similarity search."""
+
+    def __init__(self, path=None, collection_name="default"):
+        self.collection_name = collection_name
+        self.documents = []
+
+    def add_documents(self, documents, metadatas=None, ids=None):
+        # Same id checks as ChromaDB's collection.add()
+        if ids is None or len(set(ids)) != len(ids):
+            raise ValueError(f"Expected unique ids, got {ids}")
+        self.documents.extend(zip(documents, metadatas or [{}] * len(documents)))
+
+    def query(self, query_text, n_results=5):
+        return [
+            {"document": document, "metadata": metadata, "distance": 0.0}
+            for document, metadata in self.documents[:n_results]
+        ]
+
+    def get_collection_size(self):
+        return len(self.documents)
+
+    def clear(self):
+        self.documents.clear()
+
+
+@pytest.fixture
+def fake_vector_store(monkeypatch):
+    """Back DomainMemory instances created in the test with FakeVectorStore."""
+    monkeypatch.setattr("core.memory.silos.VectorStore", FakeVectorStore)
+
+
+@pytest.fixture(scope="session")
+def _domain_memories():
+    """DomainMemory instances shared across the session, keyed by domain."""
+    return {}
+
+
+@pytest.fixture
+def shared_domain_memory(_domain_memories):
+    """Return the shared DomainMemory for a domain; domains used are cleared afterwards."""
+    used = set()
+
+    def get(domain):
+        memory = _domain_memories.get(domain)
+        if memory is None:
+            memory = _domain_memories[domain] = DomainMemory(domain=domain)
+        used.add(domain)
+        return memory
+
+    yield get
+    for domain in used:
+        _domain_memories[domain].clear()
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """DomainDetector shared by the tests in this module."""
+    return DomainDetector()
+
+
+@pytest.fixture(scope="module")
+def ingester():
+    """ChatHistoryIngester shared by the tests in this module."""
+    return ChatHistoryIngester()
+
+
 class TestDomainDetector:
     """Test domain detection with keyword + LLM hybrid approach."""
 
-    def test_detect_coding_keyword(self):
-        """Should detect coding domain by keywords."""
-        detector = DomainDetector()
-        domain = detector.detect("How do I debug this Python function?")
-        assert domain == "coding"
-
-    def test_detect_music_keyword(self):
-        """Should detect music domain by keywords."""
-        detector = DomainDetector()
-        domain = detector.detect("What's a good chord progression for a jazz tune?")
-        assert domain == "music"
-
-    def test_detect_blender_keyword(self):
-        """Should detect blender domain by keywords."""
-        detector = DomainDetector()
-        domain = detector.detect("How do I rig a 3D model in Blender?")
-        assert domain == "blender"
-
-    def test_detect_study_keyword(self):
-        """Should detect study domain by keywords."""
-        detector = DomainDetector()
-        domain = detector.detect("Explain quantum entanglement in physics")
-        assert domain == "study"
-
-    def test_detect_general_fallback(self):
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            pytest.param("How do I debug this Python function?", "coding", id="coding"),
+            pytest.param("What's a good chord progression for a jazz tune?", "music", id="music"),
+            pytest.param("How do I rig a 3D model in Blender?", "blender", id="blender"),
+            pytest.param("Explain quantum entanglement in physics", "study", id="study"),
+        ],
+    )
+    def test_detect_keyword(self, detector, text, expected):
+        """Should detect the domain by keywords."""
+        assert detector.detect(text) == expected
+
+    def test_detect_general_fallback(self, detector):
         """Should default to general for unclear text."""
-        detector = DomainDetector()
         domain = detector.detect("What's the weather today?")
         assert domain in ["general", "study", "coding"]  # Could be any
 
@@ -73,10 +127,7 @@ class TestMockDataGenerator:
         domains = ["coding", "music", "blender", "study", "general"]
         conversations = generate_mock_conversations(count=50, domains=domains)
 
-        domain_counts = {}
-        for conv in conversations:
-            domain = conv["domain"]
-            domain_counts[domain] = domain_counts.get(domain, 0) + 1
+        domain_counts = Counter(conv["domain"] for conv in conversations)
 
         assert len(domain_counts) == 5
         for count in domain_counts.values():
@@ -86,10 +137,8 @@ class TestMockDataGenerator:
 class TestChatHistoryIngestion:
     """Test chat history parsing and ingestion."""
 
-    def test_ingest_json_copilot_format(self):
+    def test_ingest_json_copilot_format(self, ingester):
         """Should parse GitHub Copilot JSON format."""
-        ingester = ChatHistoryIngester()
-
         # Create mock Copilot export
         copilot_data = {
             "conversations": [
@@ -104,21 +153,12 @@ class TestChatHistoryIngestion:
             ]
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(copilot_data, f)
-            temp_file = f.name
+        conversations = ingester.ingest_json_data(copilot_data)
+        assert len(conversations) == 1
+        assert conversations[0]["domain"] in ["coding"]
 
-        try:
-            conversations = ingester.ingest_json(temp_file)
-            assert len(conversations) == 1
-            assert conversations[0]["domain"] in ["coding"]
-        finally:
-            Path(temp_file).unlink()
-
-    def test_ingest_markdown_discord(self):
+    def test_ingest_markdown_discord(self, ingester, tmp_path):
         """Should parse Discord markdown export."""
-        ingester = ChatHistoryIngester()
-
         discord_markdown = """# Discord Export
 
 **User1** - 2024-01-01 10:00 AM
@@ -133,20 +173,14 @@ It's a Dm7. Try this fingering...
 Thanks! That sounds great.
 """
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(discord_markdown)
-            temp_file = f.name
+        export_file = tmp_path / "discord.md"
+        export_file.write_text(discord_markdown)
 
-        try:
-            conversations = ingester.ingest_markdown(temp_file)
-            assert len(conversations) >= 1
-        finally:
-            Path(temp_file).unlink()
+        conversations = ingester.ingest_markdown(export_file)
+        assert len(conversations) >= 1
 
-    def test_auto_tag_generation(self):
+    def test_auto_tag_generation(self, ingester):
         """Should generate tags from content."""
-        ingester = ChatHistoryIngester()
-
         text = "How to handle async/await in Python with timeouts?"
         tags = ingester._auto_tag(text, domain="coding")
 
@@ -157,7 +191,7 @@ Thanks! That sounds great.
 class TestDomainMemory:
     """Test domain-specific memory storage."""
 
-    def test_add_conversation(self):
+    def test_add_conversation(self, fake_vector_store):
         """Should add conversation to domain memory."""
         memory = DomainMemory(domain="coding")
 
@@ -171,24 +205,44 @@ class TestDomainMemory:
 
         assert memory.get_stats()["total_documents"] > 0
 
-    def test_query_domain_memory(self):
+    def test_query_domain_memory(self, shared_domain_memory):
         """Should retrieve relevant conversations."""
-        memory = DomainMemory(domain="coding")
+        memory = shared_domain_memory("coding")
 
         # Add some conversations
-        for i in range(5):
-            conversation = {
+        memory.add_conversations([
+            {
                 "id": f"test-{i}",
                 "messages": [{"role": "user", "content": "How to handle errors in Python?"}],
                 "tags": ["error-handling"],
                 "timestamp": "2024-01-01T10:00:00Z",
             }
-            memory.add_conversation(conversation)
+            for i in range(5)
+        ])
 
         results = memory.query("error handling", top_k=3)
         assert len(results) > 0
 
-    def test_clear_domain_memory(self):
+    def test_add_conversations_ids_and_fallback(self, fake_vector_store, monkeypatch):
+        """Missing and repeated ids shouldn't fail the batch; one bad entry shouldn't lose the rest."""
+        memory = DomainMemory(domain="coding")
+        add_documents = memory.vector_store.add_documents
+
+        def reject_bad(documents, metadatas=None, ids=None):
+            if "bad" in documents:
+                raise ValueError("rejected")
+            add_documents(documents, metadatas, ids)
+
+        monkeypatch.setattr(memory.vector_store, "add_documents", reject_bad)
+
+        def conv(conv_id, text):
+            return {"id": conv_id, "messages": [{"role": "user", "content": text}]}
+
+        assert memory.add_conversations([conv("a", "one"), conv("", "two"), conv("a", "three")]) == 2
+        assert memory.add_conversations([conv("b", "four"), conv("c", "bad")]) == 1
+        assert [doc for doc, _ in memory.vector_store.documents] == ["one", "two", "four"]
+
+    def test_clear_domain_memory(self, fake_vector_store):
         """Should clear all conversations in domain."""
         memory = DomainMemory(domain="study")
 
@@ -213,12 +267,12 @@ class TestDomainMemory:
 class TestCrossDomainQuery:
     """Test cross-domain memory retrieval."""
 
-    def test_query_all_domains(self):
+    def test_query_all_domains(self, shared_domain_memory):
         """Should search across all domains."""
         cdq = CrossDomainQuery()
 
         # Add conversations to multiple domains
-        coding_memory = DomainMemory(domain="coding")
+        coding_memory = shared_domain_memory("coding")
         coding_memory.add_conversation({
             "id": "code-1",
             "messages": [{"role": "user", "content": "Python async patterns"}],
@@ -226,7 +280,7 @@ class TestCrossDomainQuery:
             "timestamp": "2024-01-01T10:00:00Z",
         })
 
-        music_memory = DomainMemory(domain="music")
+        music_memory = shared_domain_memory("music")
         music_memory.add_conversation({
             "id": "music-1",
             "messages": [{"role": "user", "content": "Jazz chord progressions"}],
@@ -247,12 +301,12 @@ class TestCrossDomainQuery:
 class TestAdvancedRAG:
     """Test retrieval-augmented generation pipeline."""
 
-    def test_rag_query_formatting(self):
+    def test_rag_query_formatting(self, shared_domain_memory):
         """Should format results for LLM injection."""
         rag = AdvancedRAG()
 
         # Add some mock data to memory first
-        memory = DomainMemory(domain="coding")
+        memory = shared_domain_memory("coding")
         memory.add_conversation({
             "id": "test-1",
             "messages": [{"role": "user", "content": "Use list comprehension for cleaner code"}],
@@ -263,6 +317,59 @@ class TestAdvancedRAG:
         results = rag.query("Python best practices", domain="coding", top_k=3)
         # Should return properly formatted list
 
+    def test_rag_query_cache(self, fake_vector_store, monkeypatch):
+        """Should reuse results for a repeated query until memory changes."""
+        rag = AdvancedRAG()
+        searches = []
+
+        def search_domain(question, domain, top_k):
+            searches.append(question)
+            return [{"document": question, "metadata": {"domain": domain}, "distance": 0.1}]
+
+        monkeypatch.setattr(rag, "_search_domain", search_domain)
+
+        first = rag.query("How to debug", domain="coding", top_k=3)
+        second = rag.query("How to debug", domain="coding", top_k=3)
+        assert first == second
+        assert len(searches) == 1
+
+        DomainMemory(domain="coding").add_conversation({
+            "id": "test-1",
+            "messages": [{"role": "user", "content": "Use pdb to debug"}],
+        })
+        rag.query("How to debug", domain="coding", top_k=3)
+        assert len(searches) == 2
+
+        # Results are copies; editing one doesn't change the cache
+        rag.query("How to debug", domain="coding", top_k=3)[0]["tags"].append("edited")
+        assert "edited" not in rag.query("How to debug", domain="coding", top_k=3)[0]["tags"]
+        assert len(searches) == 2
+
+        # Expired entries are searched again (other processes may have written)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + rag.cache_ttl)
+        rag.query("How to debug", domain="coding", top_k=3)
+        assert len(searches) == 3
+
+    def test_rag_query_cache_skips_empty(self, fake_vector_store, monkeypatch):
+        """Should not cache empty results, nor drop other cached results for them."""
+        rag = AdvancedRAG()
+        searches = []
+
+        def search_domain(question, domain, top_k):
+            searches.append(question)
+            if question == "nothing":
+                return []
+            return [{"document": question, "metadata": {"domain": domain}, "distance": 0.1}]
+
+        monkeypatch.setattr(rag, "_search_domain", search_domain)
+
+        rag.query("How to debug", domain="coding")
+        assert rag.query("nothing", domain="coding") == []
+        assert rag.query("nothing", domain="coding") == []
+        rag.query("How to debug", domain="coding")
+        assert searches == ["How to debug", "nothing", "nothing"]
+
     def test_rag_format_for_injection(self):
         """Should produce markdown for prompt injection."""
         rag = AdvancedRAG()
@@ -287,31 +394,23 @@ class TestAdvancedRAG:
 class TestEndToEndPipeline:
     """Test complete memory pipeline."""
 
-    def test_mock_data_to_memory_flow(self):
+    def test_mock_data_to_memory_flow(self, shared_domain_memory, ingester):
         """Should flow: generate → ingest → store → query."""
+        # Clean up the coding memory on teardown
+        shared_domain_memory("coding")
+
         # Generate mock data
         conversations = generate_mock_conversations(count=20, domains=["coding"])
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"conversations": conversations}, f)
-            temp_file = f.name
-
-        try:
-            # Ingest
-            ingester = ChatHistoryIngester()
-            count = ingester.ingest_and_store(temp_file)
-            assert count == 20
-
-            # Query
-            rag = AdvancedRAG()
-            results = rag.query("How to debug", domain="coding", top_k=5)
-            # Should return results from stored conversations
-
-        finally:
-            Path(temp_file).unlink()
-            # Clean up memory
-            memory = DomainMemory(domain="coding")
-            memory.clear()
+        # Ingest
+        normalized = ingester.ingest_json_data({"conversations": conversations})
+        count = ingester.store_conversations(normalized)
+        assert count == 20
+
+        # Query
+        rag = AdvancedRAG()
+        results = rag.query("How to debug", domain="coding", top_k=5)
+        # Should return results from stored conversations
 
 
 if __name__ == "__main__":
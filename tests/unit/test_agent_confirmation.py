@@ -89,11 +89,17 @@ class TestToolRiskRegistry:
 class TestRiskAssessor:
     """Tests for RiskAssessor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def assessor(self):
-        """Create assessor with default settings."""
+        """Create assessor with default settings, shared across this class."""
         return RiskAssessor(confirmation_threshold=RiskLevel.MEDIUM)
 
+    @pytest.fixture(autouse=True)
+    def _reset_trusted_tools(self, assessor):
+        """Undo trust_tool() calls so tests don't leak into each other."""
+        yield
+        assessor._trusted_tools.clear()
+
     def test_assess_safe_tool(self, assessor):
         """Should not require confirmation for safe tools."""
         assessment = assessor.assess("filesystem.read_file", {"path": "test.txt"})
@@ -181,9 +187,9 @@ class TestRiskAssessor:
 class TestConfirmationManager:
     """Tests for ConfirmationManager."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def assessment(self):
-        """Create test assessment."""
+        """Create test assessment; RiskAssessment is frozen, so it's safe to share."""
         return RiskAssessment(
             tool="filesystem.delete_file",
             arguments={"path": "test.txt"},
@@ -234,7 +240,7 @@ class TestConfirmationManager:
     async def test_request_timeout_deny(self, assessment):
         """Should deny on timeout by default."""
         async def slow_prompt(_):
-            await asyncio.sleep(10)
+            await asyncio.Event().wait()  # Never answers
             return "yes"
 
         manager = ConfirmationManager(
@@ -252,7 +258,7 @@ class TestConfirmationManager:
     async def test_request_timeout_approve(self, assessment):
         """Should approve on timeout when configured."""
         async def slow_prompt(_):
-            await asyncio.sleep(10)
+            await asyncio.Event().wait()  # Never answers
             return "no"
 
         manager = ConfirmationManager(
@@ -323,23 +329,34 @@ class TestConfirmationManager:
         assert "delete" in prompt.lower()
         assert "/data/important.db" in prompt
 
-    def test_parse_response_variations(self):
+    @pytest.fixture(scope="module")
+    def parser(self):
+        """Stateless manager shared by the response parsing cases."""
+        return ConfirmationManager()
+
+    @pytest.mark.parametrize(
+        "response, approved",
+        [
+            # Approval variations
+            ("y", True),
+            ("yes", True),
+            ("Y", True),
+            ("YES", True),
+            ("ok", True),
+            ("approve", True),
+            # Denial variations
+            ("n", False),
+            ("no", False),
+            ("N", False),
+            ("NO", False),
+            ("deny", False),
+            # Unknown defaults to deny
+            ("maybe", False),
+        ],
+    )
+    def test_parse_response_variations(self, parser, response, approved):
         """Should parse various response formats."""
-        manager = ConfirmationManager()
-
-        # Approval variations
-        for response in ["y", "yes", "Y", "YES", "ok", "approve"]:
-            result = manager._parse_response(response)
-            assert result.approved is True
-
-        # Denial variations
-        for response in ["n", "no", "N", "NO", "deny"]:
-            result = manager._parse_response(response)
-            assert result.approved is False
-
-        # Unknown defaults to deny
-        result = manager._parse_response("maybe")
-        assert result.approved is False
+        assert parser._parse_response(response).approved is approved
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
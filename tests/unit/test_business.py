@@ -0,0 +1,77 @@
+"""Tests for the desktop business database and query handler."""
+
+import sqlite3
+
+import pytest
+
+# The business package is imported through the desktop GUI package
+pytest.importorskip("customtkinter")
+
+from interfaces.desktop.business import BusinessDatabase, BusinessQueryHandler
+
+
+@pytest.fixture
+def db():
+    """Fresh in-memory business database."""
+    database = BusinessDatabase(":memory:")
+    yield database
+    database.close()
+
+
+class TestContactTypes:
+    """Contact type IDs must not outlive a rolled-back transaction."""
+
+    def test_failed_add_contact_does_not_cache_new_type(self, db):
+        """A new type from a failed insert should still work afterwards."""
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_contact(None, type="partner")
+
+        contact_id = db.add_contact("Dan", type="partner")
+        assert db.get_contact(contact_id)["name"] == "Dan"
+        assert db.update_contact(contact_id, type="partner")
+
+    def test_failed_bulk_add_leaves_no_new_type(self, db):
+        """A failed bulk add should roll back the types it added too."""
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_contacts_bulk([{"name": "Ann", "type": "reseller"}, {"name": None}])
+
+        with db._conn() as conn:
+            assert conn.execute(
+                "SELECT COUNT(*) FROM contact_types WHERE name = 'reseller'"
+            ).fetchone()[0] == 0
+        assert len(db.add_contacts_bulk([{"name": "Ann", "type": "reseller"}])) == 1
+
+
+class TestQueryCache:
+    """BusinessQueryHandler.process_query result caching."""
+
+    @pytest.fixture
+    def handler(self, db):
+        db.add_contact("Dan", email="dan@example.com")
+        return BusinessQueryHandler(db)
+
+    def test_returned_result_is_a_copy(self, handler):
+        """Changing a returned result should not change the next one."""
+        first = handler.process_query("show contacts")
+        first["data"].append({"name": "Eve"})
+        first["data"][0]["name"] = "Changed"
+
+        second = handler.process_query("show contacts")
+        assert [c["name"] for c in second["data"]] == ["Dan"]
+
+    def test_failure_is_not_cached_and_keeps_other_entries(self, handler, monkeypatch):
+        """A failed query should be retried and not evict cached results."""
+        handler.process_query("show contacts")
+        list_notes = handler.db.list_notes
+
+        def fail_once(*args, **kwargs):
+            monkeypatch.setattr(handler.db, "list_notes", list_notes)
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(handler.db, "list_notes", fail_once)
+        assert not handler.process_query("show notes")["success"]
+        assert handler.process_query("show notes")["success"]
+
+        hits = handler._cached_query.cache_info().hits
+        handler.process_query("show contacts")
+        assert handler._cached_query.cache_info().hits == hits + 1
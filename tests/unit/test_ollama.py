@@ -15,19 +15,19 @@ class TestOllamaClient:
 
     def test_health_check_success(self, client):
         """Test successful health check."""
-        with patch("requests.get") as mock_get:
+        with patch.object(client._session, "get") as mock_get:
             mock_get.return_value.status_code = 200
             assert client.health_check() is True
 
     def test_health_check_failure(self, client):
         """Test failed health check."""
-        with patch("requests.get") as mock_get:
+        with patch.object(client._session, "get") as mock_get:
             mock_get.side_effect = Exception("Connection refused")
             assert client.health_check() is False
 
     def test_list_models(self, client):
         """Test listing models."""
-        with patch("requests.get") as mock_get:
+        with patch.object(client._session, "get") as mock_get:
             mock_get.return_value.json.return_value = {
                 "models": [
                     {"name": "qwen2.5-coder:7b"},
@@ -36,3 +36,16 @@ class TestOllamaClient:
             }
             models = client.list_models()
             assert models == ["qwen2.5-coder:7b", "deepseek-r1:8b"]
+
+    def test_generate_stream(self, client):
+        """Test streaming generation yields each chunk."""
+        with patch.object(client._session, "post") as mock_post:
+            response = mock_post.return_value.__enter__.return_value
+            response.iter_lines.return_value = [
+                b'{"response": "Hel", "done": false}',
+                b"",
+                b'{"response": "lo", "done": false}',
+                b'{"response": "", "done": true}',
+            ]
+            assert list(client.generate_stream("qwen2.5-coder:7b", "Hi")) == ["Hel", "lo"]
+            assert mock_post.call_args.kwargs["stream"] is True